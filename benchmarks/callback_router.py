@@ -0,0 +1,88 @@
+# Times how long one callback query takes to find its handlers, with every handler checked one by
+# one (how hydrogram dispatches a group) and through CallbackQueryRouter, as handlers are added.
+#
+#   python benchmarks/callback_router.py [--queries 200]
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hydrogram import Client, filters
+from hydrogram.handlers import CallbackQueryHandler
+from hydrogram.types import CallbackQuery
+
+from userlixo.types.callback_query_router import CallbackQueryRouter, extract_callback_route_key
+
+HANDLER_COUNTS = (10, 100, 1000)
+
+
+async def callback(_client, _query):
+    pass
+
+
+def create_handlers(count: int) -> list[CallbackQueryHandler]:
+    # Anchored patterns like the assistant's, e.g. ^info_plugin (?P<name>.+) (?P<page>\d+)
+    return [
+        CallbackQueryHandler(callback, filters.regex(rf"^action_{i} (?P<name>\w+) (?P<page>\d+)"))
+        for i in range(count)
+    ]
+
+
+def create_query(client: Client, index: int) -> CallbackQuery:
+    return CallbackQuery(
+        client=client,
+        id=str(index),
+        from_user=None,
+        chat_instance="0",
+        data=f"action_{index} plugin 1",
+    )
+
+
+async def check_linearly(client: Client, handlers: list, query: CallbackQuery):
+    return [handler for handler in handlers if await handler.check(client, query)]
+
+
+async def check_with_router(client: Client, router: CallbackQueryRouter, query: CallbackQuery):
+    if not await router.check(client, query):
+        return []
+    return [route.handler for route in query._routes if await route.handler.check(client, query)]
+
+
+async def time_queries(check, client: Client, table, queries: list[CallbackQuery]) -> float:
+    # Microseconds per query
+    started = time.perf_counter()
+    for query in queries:
+        if not await check(client, table, query):
+            msg = f"No handler matched {query.data}"
+            raise RuntimeError(msg)
+    return (time.perf_counter() - started) / len(queries) * 1_000_000
+
+
+async def main(query_count: int):
+    client = Client("benchmark", api_id=1, api_hash="0", in_memory=True)
+    random.seed(0)
+
+    print(f"{'handlers':>8}  {'linear':>12}  {'router':>12}")
+    for count in HANDLER_COUNTS:
+        handlers = create_handlers(count)
+        router = CallbackQueryRouter()
+        for handler in handlers:
+            router.add_route(handler, extract_callback_route_key(handler.filters))
+
+        # Buttons pressed at random; every handler of the group is checked without the router
+        queries = [create_query(client, random.randrange(count)) for _ in range(query_count)]
+        linear = await time_queries(check_linearly, client, handlers, queries)
+        routed = await time_queries(check_with_router, client, router, queries)
+        print(f"{count:>8}  {linear:>10.1f}us  {routed:>10.1f}us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.queries))
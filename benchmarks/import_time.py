@@ -0,0 +1,61 @@
+# Checks that importing userlixo.__main__ (everything loaded before main() runs) stays within a
+# time budget, using `python -X importtime`. Exits with 1 when the median run is over budget.
+# The default budget is ~10% over the median measured on a dev machine (~1.35s, most of it
+# hydrogram), so a regression of a few hundred milliseconds fails it.
+#
+#   python benchmarks/import_time.py [--budget 1500] [--runs 5] [--top 10]
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE = "userlixo.__main__"
+
+
+def measure_imports() -> dict[str, tuple[int, int]]:
+    # {module: (self, cumulative)} in microseconds
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        imports[name.strip()] = (int(own), int(cumulative))
+    return imports
+
+
+def main(budget: float, runs: int, top: int) -> int:
+    samples = [measure_imports() for _ in range(runs)]
+    totals = [sample[MODULE][1] / 1000 for sample in samples]
+    median = statistics.median(totals)
+
+    slowest = sorted(samples[-1].items(), key=lambda item: item[1][0], reverse=True)[:top]
+    print(f"Slowest imports by their own time (last run, of {len(samples[-1])}):")
+    for name, (own, cumulative) in slowest:
+        print(f"  {own / 1000:8.1f}ms  {cumulative / 1000:8.1f}ms cumulative  {name}")
+
+    runs_text = ", ".join(f"{total:.0f}ms" for total in totals)
+    print(f"\nimport {MODULE}: median {median:.0f}ms ({runs_text}), budget {budget:.0f}ms")
+    if median > budget:
+        print("Over budget: something heavy is being imported at startup again")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=1500, help="milliseconds")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    sys.exit(main(args.budget, args.runs, args.top))
@@ -4,6 +4,8 @@
 import asyncio
 import logging
 import os
+import time
+from functools import partial
 from pathlib import Path
 
 import aiocron
@@ -12,18 +14,25 @@ from kink import di
 from rich.console import Console
 from rich.logging import RichHandler
 
+from userlixo.database import repositories
+from userlixo.database.migrator import apply_migrations
 from userlixo.login import main as login
 from userlixo.modules import (
     AssistantController,
     UserbotController,
 )
+from userlixo.utils.bootstrap import Phase, run_phases
 from userlixo.utils.cache import clean_cache
 from userlixo.utils.plugins import load_all_installed_plugins
 from userlixo.utils.services.language_selector import LanguageSelector
+from userlixo.utils.services.loop_monitor import LoopLagMonitor
+from userlixo.utils.services.metrics_exporter import MetricsExporter
 from userlixo.utils.startup import (
+    alert_loop_stall,
     alert_startup,
     edit_restarting_alert,
     print_cli_startup_alert,
+    send_startup_profile,
 )
 
 language_selector = di[LanguageSelector]
@@ -32,7 +41,9 @@ langs = language_selector.get_lang()
 from userlixo.config import (
     bot,
     load_env,
-    sudoers,
+    startup_profiler,
+    sudoer_registry,
+    update_checker,
     user,
 )
 
@@ -44,46 +55,71 @@ else:
 
 logger = logging.getLogger("userlixo")
 console = Console()
+background_tasks = set()
 
 
-async def bootstrap():
-    logger.debug("Loading crons...")
+def load_crons():
     aiocron.crontab("*/1 * * * *")(clean_cache)
-    logger.debug("Loaded crons!")
 
-    logger.debug("Starting clients...")
-    await user.start()
-    await bot.start()
-    logger.debug("Started clients!")
 
-    logger.debug("Saving get_me info...")
+async def save_user_info():
     user.me = await user.get_me()
+    sudoer_registry.set_owner(user.me.id)
+    background_tasks.add(asyncio.create_task(sudoer_registry.resolve_usernames(user)))
 
+
+async def save_bot_info():
     bot.me = await bot.get_me()
     user.assistant = bot
-    logger.debug("Saved get_me info!")
 
-    if user.me.id not in sudoers:
-        logger.debug("user.me.id not found in sudoers, adding it to sudoers...")
-        sudoers.append(user.me.id)
 
-    logger.debug("Loading controllers...")
+def load_controllers():
     AssistantController.__controller__.register(bot)
     UserbotController.__controller__.register(user)
-    logger.debug("Loaded controllers!")
 
-    logger.debug("Loading plugins...")
-    load_all_installed_plugins()
-    logger.debug("Loaded plugins!")
 
-    logger.debug("Editing restart alert...")
-    await edit_restarting_alert(langs)
-    logger.debug("Edited restart alert!")
+async def start_monitoring():
+    loop_monitor = di[LoopLagMonitor]
+    loop_monitor.alert = alert_loop_stall
+    loop_monitor.start()
+
+    if metrics_address := os.getenv("METRICS_ADDRESS"):
+        await di[MetricsExporter].start(metrics_address, clients=[user, bot])
+
+
+async def bootstrap() -> dict[str, float]:
+    # Independent phases run concurrently, e.g. both clients start (and call get_me) together
+    phases = [
+        Phase("crons", load_crons),
+        Phase("update_checker", update_checker.start),
+        Phase("user_start", user.start),
+        Phase("bot_start", bot.start),
+        Phase("user_get_me", save_user_info, after=("user_start",)),
+        Phase("bot_get_me", save_bot_info, after=("bot_start",)),
+        Phase("controllers", load_controllers, after=("user_get_me", "bot_get_me")),
+        Phase("monitoring", start_monitoring, after=("user_start", "bot_start")),
+        Phase("plugins", load_all_installed_plugins, after=("controllers",)),
+        Phase(
+            "restart_alert",
+            partial(edit_restarting_alert, langs),
+            after=("user_get_me", "bot_get_me"),
+        ),
+        Phase("startup_alert", partial(alert_startup, langs), after=("plugins",)),
+    ]
+    return await run_phases(phases)
 
 
 async def main():
+    startup_profiler.start()
+
+    logger.debug("Applying database migrations...")
+    with startup_profiler.measure("migrations"):
+        await repositories.run_in_db_thread(apply_migrations)
+    logger.debug("Applied database migrations!")
+
     logger.debug("Loading env vars...")
-    load_env()
+    with startup_profiler.measure("env"):
+        await load_env()
     logger.debug("Loaded env vars!")
 
     if not Path("user.session").exists() or not Path("bot.session").exists():
@@ -93,14 +129,18 @@ async def main():
         logger.debug("Logged in!")
 
     with console.status("[bold orchid]Starting UserLixo...", spinner_style="bold medium_purple2"):
-        await bootstrap()
+        started = time.perf_counter()
+        timings = await bootstrap()
+        timings["total"] = time.perf_counter() - started
 
-    logger.debug("Alerting startup...")
-    await alert_startup(langs)
-    logger.debug("Alerted startup!")
+    for name, seconds in timings.items():
+        startup_profiler.record("bootstrap" if name == "total" else name, seconds)
+    if report := startup_profiler.finish():
+        # Sent after bootstrap, so it lands right after the restart alert
+        await send_startup_profile(report)
 
     logger.debug("Printing cli startup alert...")
-    await print_cli_startup_alert()
+    await print_cli_startup_alert(timings)
 
     logger.debug("Starting idle...")
     await idle()
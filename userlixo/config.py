@@ -5,22 +5,38 @@ import configparser
 import json
 import logging
 import os
-import re
 import sys
 
 import hydrogram
 from hydrogram import filters
 from hydrogram.helpers import bki
 from hydrogram.utils import PyromodConfig
+from kink import di
 from rich import print
 
-from userlixo.database import Config
 from userlixo.types.client import Client
 from userlixo.types.plugin_info import PluginInfo
-from userlixo.utils.misc import b64decode, b64encode, tryint
+from userlixo.utils.misc import b64decode, b64encode
 from userlixo.utils.patches import edit_text, query_edit, remove_keyboard, reply_text
-
-sudoers = []
+from userlixo.utils.services.command_router import CommandRouter
+from userlixo.utils.services.config_store import ConfigStore
+from userlixo.utils.services.keyboard_stash import KeyboardStash
+from userlixo.utils.services.plugin_index import PluginIndex
+from userlixo.utils.services.repo_info import RepoInfo
+from userlixo.utils.services.startup_profiler import StartupProfiler
+from userlixo.utils.services.sudoer_registry import SudoerRegistry
+from userlixo.utils.services.system_info import SystemInfo
+from userlixo.utils.services.update_checker import UpdateChecker
+
+command_router = di[CommandRouter]
+config_store = di[ConfigStore]
+keyboard_stash = di[KeyboardStash]
+plugin_index = di[PluginIndex]
+repo_info = di[RepoInfo]
+startup_profiler = di[StartupProfiler]
+sudoer_registry = di[SudoerRegistry]
+system_info = di[SystemInfo]
+update_checker = di[UpdateChecker]
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +46,19 @@ REQUIRED_VARS = ["BOT_TOKEN", "WEB_APP_URL"]
 
 def handle_missing_var(env_key, default_value, env_info):
     value_on_env = os.getenv(env_key, default_value)
-    value_on_db = Config.get_or_none(Config.key == env_key)
+    value_on_db = config_store.get(env_key)
 
-    if not value_on_db:
+    if value_on_db is None:
         if env_key in RESTRICTED_VARS:
             os.environ[env_key] = value_on_env
         else:
             RESTRICTED_VARS.append([env_key, value_on_env, env_info])
         return
 
-    os.environ[env_key] = value_on_db.value
+    os.environ[env_key] = value_on_db
 
 
-def prompt_user_for_value(env_key, value_on_env, env_info):
+async def prompt_user_for_value(env_key, value_on_env, env_info):
     text = f"\n┌ [light_sea_green]{env_key}[/light_sea_green]"
     if value_on_env:
         text += f" [deep_sky_blue4](default: {value_on_env})[/]"
@@ -63,11 +79,10 @@ def prompt_user_for_value(env_key, value_on_env, env_info):
         logger.info("[red1]%s is required, cannot be empty.", env_key)
         sys.exit()
 
-    row = Config.create(key=env_key, value=user_value)
-    os.environ[env_key] = row.value
+    await config_store.set(env_key, user_value)
 
 
-def load_env():
+async def load_env():
     environment_vars: dict = {
         "DATABASE_URL": [
             "sqlite://userlixo/database/database.sqlite",
@@ -88,31 +103,31 @@ use your userbot/assistant.",
         "WEB_APP_URL": ["https://webapp.pauxis.dev/userlixo/", "URL of the webapp."],
     }
 
+    def sync_environ(key: str, value: str | None):
+        if key in environment_vars and value is not None:
+            os.environ[key] = value
+
+    await config_store.load()
+    config_store.subscribe(sync_environ)
+
     missing_vars = []
 
     for env_key, (default_value, env_info) in environment_vars.items():
         handle_missing_var(env_key, default_value, env_info)
 
-    if not missing_vars:
-        return
-
-    if len(missing_vars) == len(environment_vars) - len(RESTRICTED_VARS):
-        text = "[dodger_blue1 bold underline]Welcome to UserLixo![/][deep_sky_blue1]\nAs the \
+    if missing_vars:
+        if len(missing_vars) == len(environment_vars) - len(RESTRICTED_VARS):
+            text = "[dodger_blue1 bold underline]Welcome to UserLixo![/][deep_sky_blue1]\nAs the \
 first step we need to setup some config vars.\n\nYou will be asked for a value for each var, but \
 you can just press enter to leave it empty or use the default value. Let's get started![/]"
-    else:
-        text = "[bold yellow]Some required config vars are missing. Let's add them.[/]"
-    logger.info(text)
+        else:
+            text = "[bold yellow]Some required config vars are missing. Let's add them.[/]"
+        logger.info(text)
 
-    for env_key, value_on_env, env_info in missing_vars:
-        prompt_user_for_value(env_key, value_on_env, env_info)
+        for env_key, value_on_env, env_info in missing_vars:
+            await prompt_user_for_value(env_key, value_on_env, env_info)
 
-    # Sanitize sudoers list
-    parts = os.getenv("SUDOERS_LIST").split()
-    parts = [*(tryint(x.lstrip("@").lower()) for x in parts)]
-    parts = [*set(parts)]
-    parts = [x for x in parts if x != "me"]
-    sudoers.extend(parts)
+    sudoer_registry.load(os.getenv("SUDOERS_LIST"))
 
 
 # Extra **kwargs for creating hydrogram.Client (contains api_hash and api_id)
@@ -131,26 +146,19 @@ bot_token = config.get("hydrogram", "bot_token", fallback=None)
 def filter_sudoers_logic(flt, c, u):
     if not u.from_user:
         return None
-    user = u.from_user
-    return user.id in sudoers or (user.username and user.username.lower() in sudoers)
+    return sudoer_registry.is_sudoer(u.from_user)
 
 
 def filter_su_cmd(command, prefixes=None, *args, **kwargs):
-    def callback(flt, c, u):
-        _prefixes = prefixes or os.getenv("PREFIXES") or "."
-        prefix = ""
-        if " " in _prefixes:
-            _prefixes = "|".join(re.escape(prefix) for prefix in _prefixes.split())
-            prefix = f"({_prefixes})"
-        elif isinstance(_prefixes, list | str):
-            if isinstance(_prefixes, list):
-                _prefixes = "".join(_prefixes)
-            prefix = f"[{re.escape(_prefixes)}]"
+    route = command_router.add(command, prefixes, *args, **kwargs)
 
+    def callback(flt, c, u):
         in_sudoers = filters.sudoers(c, u)
-        matches = filters.regex(r"^" + prefix + command, *args, **kwargs)(c, u)
 
-        return in_sudoers and matches
+        if u.text or u.caption:
+            u.matches = command_router.resolve_update(u).get(route.id)
+
+        return in_sudoers and bool(u.matches)
 
     return filters.create(callback, "FilterSuCmd")
 
@@ -216,6 +224,7 @@ cmds_list = [
     "plugins",
     "commands",
     "start",
+    "metrics",
 ]
 cmds = dict.fromkeys(cmds_list, 1)
 
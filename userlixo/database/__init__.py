@@ -2,6 +2,7 @@
 # Copyright (c) 2018-2022 Amano Team
 
 
-from .database import Config, Message, PluginSetting
+from . import repositories
+from .database import Config, PluginSetting
 
-__all__: list[str] = ["Config", "Message", "PluginSetting"]
+__all__: list[str] = ["Config", "PluginSetting", "repositories"]
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+from peewee import AutoField, CharField, Model
+from playhouse.migrate import SchemaMigrator
+
+
+# Frozen copies of the original tables, later migrations change them from here
+class Config(Model):
+    key = CharField()
+    value = CharField()
+
+    class Meta:
+        table_name = "config"
+
+
+class Message(Model):
+    key = AutoField()
+    keyboard = CharField()
+    text = CharField()
+
+    class Meta:
+        table_name = "message"
+
+
+class PluginSetting(Model):
+    key = CharField()
+    plugin = CharField()
+    value = CharField()
+
+    class Meta:
+        table_name = "pluginsetting"
+
+
+def upgrade(migrator: SchemaMigrator):
+    # Installs from before migrations existed already have these tables
+    models = [Config, Message, PluginSetting]
+    with migrator.database.bind_ctx(models):
+        migrator.database.create_tables(models)
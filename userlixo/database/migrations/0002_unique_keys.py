@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+from peewee import Table, fn
+from playhouse.migrate import SchemaMigrator, migrate
+
+
+def drop_duplicate_rows(migrator: SchemaMigrator, table_name: str, *columns: str):
+    # Keys weren't unique before, keep only the newest row of each one
+    table = Table(table_name, ("id", *columns)).bind(migrator.database)
+    newest = table.select(fn.MAX(table.id)).group_by(*(getattr(table, c) for c in columns))
+    table.delete().where(table.id.not_in(newest)).execute()
+
+
+def upgrade(migrator: SchemaMigrator):
+    drop_duplicate_rows(migrator, "config", "key")
+    drop_duplicate_rows(migrator, "pluginsetting", "plugin", "key")
+
+    migrate(
+        migrator.add_index("config", ("key",), unique=True),
+        migrator.add_index("pluginsetting", ("plugin", "key"), unique=True),
+    )
@@ -0,0 +1,10 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+from playhouse.migrate import SchemaMigrator
+
+
+def upgrade(migrator: SchemaMigrator):
+    # Keyboards sent through the inline bot are stashed in memory now; rows left here were
+    # never requested and would only keep piling up
+    migrator.database.execute_sql("DROP TABLE IF EXISTS message")
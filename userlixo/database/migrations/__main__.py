@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+import logging
+import sys
+
+from rich import print
+from rich.logging import RichHandler
+
+from userlixo.database.migrator import apply_migrations
+
+# python -m userlixo.database.migrations [--dry-run]
+logging.basicConfig(level="INFO", handlers=[RichHandler()])
+dry_run = "--dry-run" in sys.argv
+
+migrations = apply_migrations(dry_run=dry_run)
+if not migrations:
+    print("[green]The database schema is up to date.[/]")
+elif dry_run:
+    print(f"[yellow]{len(migrations)} pending migration(s):[/]")
+    for migration in migrations:
+        print(f"[yellow]    {migration}[/]")
+else:
+    print(f"[green]Applied {len(migrations)} migration(s).[/]")
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+import importlib
+import logging
+import pkgutil
+import re
+import time
+from dataclasses import dataclass
+
+from playhouse.migrate import SchemaMigrator
+
+from .database import SchemaVersion, database
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_PACKAGE = "userlixo.database.migrations"
+# Scripts are named like 0001_initial.py and applied in version order
+MIGRATION_NAME = re.compile(r"^(?P<version>\d{4})_(?P<name>\w+)$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    module_name: str
+
+    def apply(self, migrator: SchemaMigrator):
+        module = importlib.import_module(self.module_name)
+        module.upgrade(migrator)
+
+    def __str__(self):
+        return f"{self.version:04d}_{self.name}"
+
+
+def discover_migrations() -> list[Migration]:
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+
+    migrations: dict[int, Migration] = {}
+    for module in pkgutil.iter_modules(package.__path__):
+        match = MIGRATION_NAME.match(module.name)
+        if not match:
+            continue
+
+        migration = Migration(
+            int(match["version"]), match["name"], f"{MIGRATIONS_PACKAGE}.{module.name}"
+        )
+        if migration.version in migrations:
+            msg = f"Duplicate migration version: {migrations[migration.version]} and {migration}"
+            raise ValueError(msg)
+        migrations[migration.version] = migration
+
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def get_pending_migrations() -> list[Migration]:
+    database.create_tables([SchemaVersion])
+    applied = {row.version for row in SchemaVersion.select(SchemaVersion.version)}
+    return [m for m in discover_migrations() if m.version not in applied]
+
+
+def apply_migrations(dry_run: bool = False) -> list[Migration]:
+    with database.connection_context():
+        pending = get_pending_migrations()
+        if dry_run or not pending:
+            return pending
+
+        migrator = SchemaMigrator.from_database(database)
+        started = time.perf_counter()
+        for migration in pending:
+            migration_started = time.perf_counter()
+            # The version is recorded in the same transaction, a failed migration leaves no trace
+            with database.atomic():
+                migration.apply(migrator)
+                SchemaVersion.create(version=migration.version, name=migration.name)
+            logger.info(
+                "Applied migration %s in %.3fs", migration, time.perf_counter() - migration_started
+            )
+
+        logger.info(
+            "Applied %d migration(s) in %.3fs", len(pending), time.perf_counter() - started
+        )
+        return pending
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2018-2022 Amano Team
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+from playhouse.pool import PooledDatabase
+
+from .database import Config, PluginSetting, database
+
+# Queries run in these threads so the event loop never waits on disk or network I/O. SQLite has
+# a single writer anyway, so one thread (keeping its connection open) runs every query; pooled
+# databases get one thread per connection, which is borrowed per task and returned afterwards.
+is_pooled = isinstance(database, PooledDatabase)
+executor = ThreadPoolExecutor(
+    max_workers=database._max_connections if is_pooled else 1, thread_name_prefix="database"
+)
+
+
+async def run_in_db_thread(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def db_task(func):
+    # Runs the decorated function in a database thread, inside a transaction
+    def atomic(*args, **kwargs):
+        if is_pooled:
+            with database.connection_context(), database.atomic():
+                return func(*args, **kwargs)
+
+        with database.atomic():
+            return func(*args, **kwargs)
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_in_db_thread(atomic, *args, **kwargs)
+
+    return wrapper
+
+
+@db_task
+def get_all_config() -> dict[str, str]:
+    return {row.key: row.value for row in Config.select()}
+
+
+@db_task
+def set_config(key: str, value: str):
+    Config.insert(key=key, value=value).on_conflict(
+        conflict_target=[Config.key], preserve=[Config.value]
+    ).execute()
+
+
+@db_task
+def delete_config(key: str):
+    Config.delete().where(Config.key == key).execute()
+
+
+@db_task
+def get_plugin_settings(plugin: str) -> dict[str, str]:
+    query = PluginSetting.select().where(PluginSetting.plugin == plugin)
+    return {row.key: row.value for row in query}
+
+
+@db_task
+def set_plugin_setting(plugin: str, key: str, value):
+    PluginSetting.insert(plugin=plugin, key=key, value=value).on_conflict(
+        conflict_target=[PluginSetting.plugin, PluginSetting.key], preserve=[PluginSetting.value]
+    ).execute()
+
+
+@db_task
+def delete_plugin_setting(plugin: str, key: str):
+    PluginSetting.delete().where(
+        (PluginSetting.plugin == plugin) & (PluginSetting.key == key)
+    ).execute()
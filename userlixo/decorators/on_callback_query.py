@@ -3,6 +3,7 @@ from collections.abc import Callable
 from hydrogram.filters import Filter
 
 from userlixo.config import filter_sudoers
+from userlixo.types.callback_query_router import extract_callback_route_key
 
 
 def on_callback_query(
@@ -11,6 +12,7 @@ def on_callback_query(
     def decorator(func: Callable) -> Callable:
         func.on = "callback_query"
         func.group = group
+        func.callback_route_key = extract_callback_route_key(filters)
 
         func.filters = filters
         if sudoers_only:
@@ -1,4 +1,3 @@
 from .about_callback_query_controller import AboutCallbackQueryController
-from .about_callback_query_handler import AboutCallbackQueryHandler
 
-__all__ = ["AboutCallbackQueryController", "AboutCallbackQueryHandler"]
+__all__ = ["AboutCallbackQueryController"]
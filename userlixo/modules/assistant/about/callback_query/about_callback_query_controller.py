@@ -3,16 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .about_callback_query_handler import (
-    AboutCallbackQueryHandler,
-)
+about_callback_query_handler = lazy_import(".about_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class AboutCallbackQueryController:
-    handler: AboutCallbackQueryHandler
+    handler: "about_callback_query_handler.AboutCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^about_(?P<subject>userlixo|plugins|commands)"))
     async def about_userlixo(self, _c, callback_query):
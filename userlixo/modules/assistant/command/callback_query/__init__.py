@@ -1,9 +1,3 @@
 from .command_callback_query_controller import CommandCallbackQueryController
-from .info_command_callback_query_handler import InfoCommandCallbackQueryHandler
-from .list_commands_callback_query_handler import ListCommandsCallbackQueryHandler
 
-__all__ = [
-    "CommandCallbackQueryController",
-    "InfoCommandCallbackQueryHandler",
-    "ListCommandsCallbackQueryHandler",
-]
+__all__ = ["CommandCallbackQueryController"]
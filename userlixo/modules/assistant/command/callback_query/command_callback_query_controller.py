@@ -3,16 +3,21 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .info_command_callback_query_handler import InfoCommandCallbackQueryHandler
-from .list_commands_callback_query_handler import ListCommandsCallbackQueryHandler
+info_command_callback_query_handler = lazy_import(
+    ".info_command_callback_query_handler", __package__
+)
+list_commands_callback_query_handler = lazy_import(
+    ".list_commands_callback_query_handler", __package__
+)
 
 
 @controller
 @dataclass
 class CommandCallbackQueryController:
-    list_commands_handler: ListCommandsCallbackQueryHandler
-    info_commands_handler: InfoCommandCallbackQueryHandler
+    list_commands_handler: "list_commands_callback_query_handler.ListCommandsCallbackQueryHandler"
+    info_commands_handler: "info_command_callback_query_handler.InfoCommandCallbackQueryHandler"
 
     @on_callback_query(filters.regex(r"^list_commands (?P<page>\d+)"))
     async def list_commands(self, c, callback_query):
@@ -8,7 +8,7 @@ from hydrogram.types import CallbackQuery, Message
 from langs import Langs
 
 from userlixo.config import bot, plugins
-from userlixo.database import PluginSetting
+from userlixo.database import repositories
 from userlixo.modules.common.plugins import compose_plugin_info_text
 from userlixo.types.client import Client
 from userlixo.types.plugin_settings import PluginSettings
@@ -234,12 +234,7 @@ async def handle_plugin_settings_loop(  # noqa: PLR0917
 
             plugin_setting.value = value
 
-            does_exist = PluginSetting.get_or_none(plugin=plugin_name, key=key)
-            if does_exist:
-                does_exist.value = msg.text
-                does_exist.save()
-            else:
-                PluginSetting.create(plugin=plugin_name, key=key, value=msg.text)
+            await repositories.set_plugin_setting(plugin_name, key, msg.text)
 
         text, keyboard = compose_plugin_settings_open_message(
             lang, setting, plugin_name, key, settings_page, options_page, plugins_page
@@ -4,7 +4,7 @@ from hydrogram import Client
 from hydrogram.helpers import array_chunk, ikb
 from langs import Langs
 
-from userlixo.config import bot, sudoers, user
+from userlixo.config import bot, sudoer_registry, user
 
 
 async def compose_list_sudoers_message(lang: Langs, client: Client, from_user_id: int):
@@ -12,7 +12,7 @@ async def compose_list_sudoers_message(lang: Langs, client: Client, from_user_id
 
     buttons = []
     added = []
-    for user_id in sudoers:
+    for user_id in sudoer_registry.members:
         try:
             user_obj = await client.get_users(user_id)
         except BaseException:
@@ -1,13 +1,3 @@
-from .edit_env_callback_query_handler import EditEnvCallbackQueryHandler
 from .env_vars_callback_query_controller import EnvVarsCallbackQueryController
-from .restart_now_callback_query_handler import RestartNowCallbackQueryHandler
-from .setting_env_callback_query_handler import SettingEnvCallbackQueryHandler
-from .view_env_callback_query_handler import ViewEnvCallbackQueryHandler
 
-__all__ = [
-    "EditEnvCallbackQueryHandler",
-    "EnvVarsCallbackQueryController",
-    "RestartNowCallbackQueryHandler",
-    "SettingEnvCallbackQueryHandler",
-    "ViewEnvCallbackQueryHandler",
-]
+__all__ = ["EnvVarsCallbackQueryController"]
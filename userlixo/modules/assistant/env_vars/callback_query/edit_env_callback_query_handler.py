@@ -7,7 +7,7 @@ from hydrogram.helpers import ikb
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.database import Config
+from userlixo.config import config_store
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.utils.services.language_selector import LanguageSelector
 
@@ -23,7 +23,7 @@ class EditEnvCallbackQueryHandler(CallbackQueryHandler):
         lang = self.language_selector.get_lang()
 
         key = query.matches[0]["key"]
-        value = (Config.get_or_none(Config.key == key)).value
+        value = config_store.get(key)
 
         text = lang.edit_env_text(key=key, value=value)
         keyboard = ikb([[(lang.back, "setting_env")]])
@@ -35,7 +35,7 @@ class EditEnvCallbackQueryHandler(CallbackQueryHandler):
                 user_id = query.from_user.id
                 msg = await query.from_user.listen(chat_id=user_id, filters=filters.text)
                 await last_msg.remove_keyboard()
-                Config.update(value=msg.text).where(Config.key == key).execute()
+                await config_store.set(key, msg.text)
                 if key in env_requires_restart:
                     text = lang.edit_env_text_restart(key=key, value=msg.text)
                     keyboard = ikb([
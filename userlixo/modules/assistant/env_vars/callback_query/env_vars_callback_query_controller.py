@@ -3,20 +3,25 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .edit_env_callback_query_handler import EditEnvCallbackQueryHandler
-from .restart_now_callback_query_handler import RestartNowCallbackQueryHandler
-from .setting_env_callback_query_handler import SettingEnvCallbackQueryHandler
-from .view_env_callback_query_handler import ViewEnvCallbackQueryHandler
+edit_env_callback_query_handler = lazy_import(".edit_env_callback_query_handler", __package__)
+restart_now_callback_query_handler = lazy_import(
+    ".restart_now_callback_query_handler", __package__
+)
+setting_env_callback_query_handler = lazy_import(
+    ".setting_env_callback_query_handler", __package__
+)
+view_env_callback_query_handler = lazy_import(".view_env_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class EnvVarsCallbackQueryController:
-    setting_env_handler: SettingEnvCallbackQueryHandler
-    edit_env_handler: EditEnvCallbackQueryHandler
-    view_env_handler: ViewEnvCallbackQueryHandler
-    restart_now_handler: RestartNowCallbackQueryHandler
+    setting_env_handler: "setting_env_callback_query_handler.SettingEnvCallbackQueryHandler"
+    edit_env_handler: "edit_env_callback_query_handler.EditEnvCallbackQueryHandler"
+    view_env_handler: "view_env_callback_query_handler.ViewEnvCallbackQueryHandler"
+    restart_now_handler: "restart_now_callback_query_handler.RestartNowCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^setting_env"))
     async def setting_env(self, c, callback_query):
@@ -29,5 +29,5 @@ class RestartNowCallbackQueryHandler(CallbackQueryHandler):
             chat_id = query.message.chat.id
             message_id = query.message.id
 
-        save_before_restart_message_info(message_id, chat_id, "bot")
+        await save_before_restart_message_info(message_id, chat_id, "bot")
         self_restart_process()
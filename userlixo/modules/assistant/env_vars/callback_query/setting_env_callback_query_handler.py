@@ -4,8 +4,7 @@ from hydrogram.helpers import array_chunk, ikb
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.config import bot
-from userlixo.database import Config
+from userlixo.config import bot, config_store
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.utils.services.language_selector import LanguageSelector
 
@@ -21,10 +20,10 @@ class SettingEnvCallbackQueryHandler(CallbackQueryHandler):
         if query.message:
             await query.message.chat.stop_listening()
         buttons = []
-        for row in Config.select():
-            btn = (f"👁‍🗨 {row.key}", f"view_env {row.key}")
+        for key in config_store.values:
+            btn = (f"👁‍🗨 {key}", f"view_env {key}")
             if query.message and query.message.from_user.id == bot.me.id:
-                btn = (f"📝 {row.key}", f"edit_env {row.key}")
+                btn = (f"📝 {key}", f"edit_env {key}")
             buttons.append(btn)
         lines = array_chunk(buttons, 2)
         lines.append([(lang.back, "settings")])
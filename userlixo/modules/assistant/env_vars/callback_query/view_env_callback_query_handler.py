@@ -1,7 +1,7 @@
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.database import Config
+from userlixo.config import config_store
 from userlixo.modules.abstract import CallbackQueryHandler
 
 
@@ -10,5 +10,5 @@ class ViewEnvCallbackQueryHandler(CallbackQueryHandler):
     @staticmethod
     async def handle_callback_query(_client, query: CallbackQuery):
         key = query.matches[0]["key"]
-        value = Config.get_or_none(Config.key == key).value
+        value = config_store.get(key)
         await query.answer(value, show_alert=True)
@@ -4,18 +4,19 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .cmd_message_handler import CmdMessageHandler
-from .eval_message_handler import EvalMessageHandler
-from .exec_message_handler import ExecMessageHandler
+cmd_message_handler = lazy_import(".cmd_message_handler", __package__)
+eval_message_handler = lazy_import(".eval_message_handler", __package__)
+exec_message_handler = lazy_import(".exec_message_handler", __package__)
 
 
 @controller
 @dataclass
 class ExecsMessageController:
-    cmd_handler: CmdMessageHandler
-    eval_handler: EvalMessageHandler
-    exec_handler: ExecMessageHandler
+    cmd_handler: "cmd_message_handler.CmdMessageHandler"
+    eval_handler: "eval_message_handler.EvalMessageHandler"
+    exec_handler: "exec_message_handler.ExecMessageHandler"
 
     @on_message(filters.regex(r"^/(?P<command>cmd|sh)\s+(?P<code>.+)", flags=re.DOTALL))
     async def cmd_sh(self, client: Client, message):
@@ -1,4 +1,3 @@
 from .help_callback_query_controller import HelpCallbackQueryController
-from .help_callback_query_handler import HelpCallbackQueryHandler
 
-__all__ = ["HelpCallbackQueryController", "HelpCallbackQueryHandler"]
+__all__ = ["HelpCallbackQueryController"]
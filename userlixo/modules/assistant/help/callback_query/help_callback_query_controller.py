@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .help_callback_query_handler import HelpCallbackQueryHandler
+help_callback_query_handler = lazy_import(".help_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class HelpCallbackQueryController:
-    handler: HelpCallbackQueryHandler
+    handler: "help_callback_query_handler.HelpCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^help"))
     async def help(self, c, callback_query):
@@ -1,4 +1,3 @@
 from .help_message_controller import HelpMessageController
-from .help_message_handler import HelpMessageHandler
 
-__all__ = ["HelpMessageController", "HelpMessageHandler"]
+__all__ = ["HelpMessageController"]
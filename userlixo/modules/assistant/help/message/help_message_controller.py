@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .help_message_handler import HelpMessageHandler
+help_message_handler = lazy_import(".help_message_handler", __package__)
 
 
 @controller
 @dataclass
 class HelpMessageController:
-    handler: HelpMessageHandler
+    handler: "help_message_handler.HelpMessageHandler"
 
     @on_message(filters.command("help"))
     async def on_help(self, client, message):
@@ -1,4 +1,3 @@
 from .index_inline_query_controller import IndexInlineQueryController
-from .index_inline_query_handler import IndexInlineQueryHandler
 
-__all__ = ["IndexInlineQueryController", "IndexInlineQueryHandler"]
+__all__ = ["IndexInlineQueryController"]
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_inline_query
+from userlixo.utils.lazy import lazy_import
 
-from .index_inline_query_handler import IndexInlineQueryHandler
+index_inline_query_handler = lazy_import(".index_inline_query_handler", __package__)
 
 
 @controller
 @dataclass
 class IndexInlineQueryController:
-    handler: IndexInlineQueryHandler
+    handler: "index_inline_query_handler.IndexInlineQueryHandler"
 
     @on_inline_query(filters.regex(r"^(?P<index>\d+)"))
     async def index(self, _c, inline_query):
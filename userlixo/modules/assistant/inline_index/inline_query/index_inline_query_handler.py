@@ -1,5 +1,3 @@
-import json
-
 from hydrogram.helpers import ikb
 from hydrogram.types import (
     InlineQuery,
@@ -8,16 +6,17 @@ from hydrogram.types import (
 )
 from kink import inject
 
-from userlixo.database import Message
+from userlixo.config import keyboard_stash
 from userlixo.modules.abstract import InlineQueryHandler
+from userlixo.utils.services.keyboard_stash import RESULT_CACHE_TIME
 
 
 @inject
 class IndexInlineQueryHandler(InlineQueryHandler):
     @staticmethod
     async def handle_inline_query(_c, iq: InlineQuery):
-        index = int(iq.matches[0]["index"])
-        message = Message.get_or_none(Message.key == index)
+        index = iq.matches[0]["index"]
+        message = await keyboard_stash.get(index)
         if not message:
             results = [
                 InlineQueryResultArticle(
@@ -27,18 +26,17 @@ class IndexInlineQueryHandler(InlineQueryHandler):
             ]
             return await iq.answer(results, cache_time=0)
 
-        reply_markup = json.loads(message.keyboard)
-        keyboard = ikb(reply_markup)
+        keyboard = ikb(message.keyboard)
         text = message.text
 
         results = [
             InlineQueryResultArticle(
+                id=index,
                 title="index",
                 input_message_content=InputTextMessageContent(text, disable_web_page_preview=True),
                 reply_markup=keyboard,
             )
         ]
 
-        await iq.answer(results, cache_time=0)
-        Message.get(Message.key == message.key).delete_instance()
-        return None
+        # The index is derived from the content, so the same answer stays right while cached
+        return await iq.answer(results, cache_time=RESULT_CACHE_TIME, is_personal=True)
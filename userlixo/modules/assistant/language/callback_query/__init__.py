@@ -1,9 +1,3 @@
 from .language_callback_query_controller import LanguageCallbackQueryController
-from .set_language_code_callback_query_handler import SetLanguageCodeCallbackQueryHandler
-from .setting_language_callback_query_handler import SettingLanguageCallbackQueryHandler
 
-__all__ = [
-    "LanguageCallbackQueryController",
-    "SetLanguageCodeCallbackQueryHandler",
-    "SettingLanguageCallbackQueryHandler",
-]
+__all__ = ["LanguageCallbackQueryController"]
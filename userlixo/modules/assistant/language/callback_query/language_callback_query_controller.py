@@ -3,16 +3,25 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .set_language_code_callback_query_handler import SetLanguageCodeCallbackQueryHandler
-from .setting_language_callback_query_handler import SettingLanguageCallbackQueryHandler
+set_language_code_callback_query_handler = lazy_import(
+    ".set_language_code_callback_query_handler", __package__
+)
+setting_language_callback_query_handler = lazy_import(
+    ".setting_language_callback_query_handler", __package__
+)
 
 
 @controller
 @dataclass
 class LanguageCallbackQueryController:
-    setting_language_handler: SettingLanguageCallbackQueryHandler
-    set_language_code_handler: SetLanguageCodeCallbackQueryHandler
+    setting_language_handler: (
+        "setting_language_callback_query_handler.SettingLanguageCallbackQueryHandler"
+    )
+    set_language_code_handler: (
+        "set_language_code_callback_query_handler.SetLanguageCodeCallbackQueryHandler"
+    )
 
     @on_callback_query(filters.regex("^setting_language"))
     async def setting_language(self, _c, callback_query):
@@ -1,11 +1,10 @@
-import os
 from dataclasses import dataclass
 
 from hydrogram.helpers import array_chunk, ikb
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.database import Config
+from userlixo.config import config_store
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.utils.services.language_selector import LanguageSelector
 
@@ -20,8 +19,7 @@ class SetLanguageCodeCallbackQueryHandler(CallbackQueryHandler):
 
         match = query.matches[0]
         lang = lang.get_language(match["code"])
-        Config.update(value=lang.code).where(Config.key == "LANGUAGE").execute()
-        os.environ["LANGUAGE"] = lang.code
+        await config_store.set("LANGUAGE", lang.code)
         buttons = []
         for obj in lang.strings.values():
             text, data = (
@@ -1,4 +1,3 @@
 from .ping_callback_query_controller import PingCallbackQueryController
-from .ping_callback_query_handler import PingCallbackQueryHandler
 
-__all__ = ["PingCallbackQueryController", "PingCallbackQueryHandler"]
+__all__ = ["PingCallbackQueryController"]
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .ping_callback_query_handler import PingCallbackQueryHandler
+ping_callback_query_handler = lazy_import(".ping_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class PingCallbackQueryController:
-    handler: PingCallbackQueryHandler
+    handler: "ping_callback_query_handler.PingCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^ping"))
     async def ping(self, client, callback_query):
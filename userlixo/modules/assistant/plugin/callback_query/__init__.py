@@ -1,21 +1,3 @@
-from .add_plugin_callback_query_handler import AddPluginCallbackQueryHandler
-from .cancel_plugin_callback_query_handler import CancelPluginCallbackQueryHandler
-from .confirm_add_plugin_callback_query_handler import (
-    ConfirmAddPluginCallbackQueryHandler,
-)
-from .info_plugin_callback_query_handler import InfoPluginCallbackQueryHandler
-from .list_plugins_callback_query_handler import ListPluginsCallbackQueryHandler
 from .plugin_callback_query_controller import PluginCallbackQueryController
-from .remove_plugin_callback_query_handler import RemovePluginCallbackQueryHandler
-from .toggle_plugin_callback_query_handler import TogglePluginCallbackQueryHandler
 
-__all__ = [
-    "AddPluginCallbackQueryHandler",
-    "CancelPluginCallbackQueryHandler",
-    "ConfirmAddPluginCallbackQueryHandler",
-    "InfoPluginCallbackQueryHandler",
-    "ListPluginsCallbackQueryHandler",
-    "PluginCallbackQueryController",
-    "RemovePluginCallbackQueryHandler",
-    "TogglePluginCallbackQueryHandler",
-]
+__all__ = ["PluginCallbackQueryController"]
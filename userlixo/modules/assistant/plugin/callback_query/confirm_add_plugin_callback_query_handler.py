@@ -1,3 +1,4 @@
+import html
 import math
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,10 +10,13 @@ from kink import inject
 from userlixo.config import plugins
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.utils.plugins import (
+    activate_plugin,
+    discard_plugin_backup,
     get_plugin_info_from_folder,
-    load_plugin,
-    unload_and_remove_plugin,
-    unzip_plugin_to_folder,
+    prepare_plugin,
+    rollback_plugin,
+    stage_plugin,
+    swap_in_plugin,
 )
 from userlixo.utils.services.language_selector import LanguageSelector
 
@@ -34,29 +38,40 @@ class ConfirmAddPluginCallbackQueryHandler(CallbackQueryHandler):
             lang.starting_plugin_installation(name=basename), reply_markup=loading_keyboard
         )
 
+        # Extracted and checked aside, then renamed into place: a failure never leaves a
+        # half-extracted plugin behind
         try:
-            unzip_plugin_to_folder(cache_filename, basename)
+            staged = await stage_plugin(cache_filename, basename)
         except Exception as e:
             await query.edit(lang.plugin_could_not_unzip(e=str(e)))
             return
 
-        await query.edit(
-            lang.starting_plugin_elements_loading(name=basename), reply_markup=loading_keyboard
-        )
+        try:
+            backup = swap_in_plugin(staged, basename)
+        except OSError as e:
+            await query.edit(lang.plugin_could_not_load(e=str(e)))
+            return
 
         try:
-            load_plugin(basename)
+            requirements = "\n".join(get_plugin_info_from_folder(basename).requirements)
+            await query.edit(
+                lang.installing_plugin_requirements(requirements=html.escape(requirements)),
+                reply_markup=loading_keyboard,
+            )
+            plugin_info = await prepare_plugin(basename)
+
+            await query.edit(
+                lang.starting_plugin_elements_loading(name=basename), reply_markup=loading_keyboard
+            )
+            # The version being replaced keeps running until the new one is prepared
+            await activate_plugin(basename, replace=backup is not None)
         except Exception as e:
+            # Puts back whatever was there before
+            await rollback_plugin(basename, backup)
             await query.edit(lang.plugin_could_not_load(e=str(e)))
-            unload_and_remove_plugin(basename)
             return
 
-        await query.edit(
-            lang.starting_plugin_info_saving(name=basename), reply_markup=loading_keyboard
-        )
-
-        plugin_info = get_plugin_info_from_folder(basename)
-
+        await discard_plugin_backup(basename, backup)
         plugins[basename] = plugin_info
 
         # Discover which page is this plugin listed in
@@ -3,36 +3,71 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
-
-from .add_plugin_callback_query_handler import AddPluginCallbackQueryHandler
-from .cancel_plugin_callback_query_handler import CancelPluginCallbackQueryHandler
-from .confirm_add_plugin_callback_query_handler import ConfirmAddPluginCallbackQueryHandler
-from .info_plugin_callback_query_handler import InfoPluginCallbackQueryHandler
-from .list_plugins_callback_query_handler import ListPluginsCallbackQueryHandler
-from .plugin_setting_open_callback_query_handler import PluginSettingOpenCallbackQueryHandler
-from .plugin_setting_reset_callback_query_handler import PluginSettingResetCallbackQueryHandler
-from .plugin_setting_select_callback_query_handler import PluginSettingSelectCallbackQueryHandler
-from .plugin_setting_toggle_callback_query_handler import PluginSettingToggleCallbackQueryHandler
-from .plugin_settings_callback_query_handler import PluginSettingsCallbackQueryHandler
-from .remove_plugin_callback_query_handler import RemovePluginCallbackQueryHandler
-from .toggle_plugin_callback_query_handler import TogglePluginCallbackQueryHandler
+from userlixo.utils.lazy import lazy_import
+
+add_plugin_callback_query_handler = lazy_import(".add_plugin_callback_query_handler", __package__)
+cancel_plugin_callback_query_handler = lazy_import(
+    ".cancel_plugin_callback_query_handler", __package__
+)
+confirm_add_plugin_callback_query_handler = lazy_import(
+    ".confirm_add_plugin_callback_query_handler", __package__
+)
+info_plugin_callback_query_handler = lazy_import(
+    ".info_plugin_callback_query_handler", __package__
+)
+list_plugins_callback_query_handler = lazy_import(
+    ".list_plugins_callback_query_handler", __package__
+)
+plugin_setting_open_callback_query_handler = lazy_import(
+    ".plugin_setting_open_callback_query_handler", __package__
+)
+plugin_setting_reset_callback_query_handler = lazy_import(
+    ".plugin_setting_reset_callback_query_handler", __package__
+)
+plugin_setting_select_callback_query_handler = lazy_import(
+    ".plugin_setting_select_callback_query_handler", __package__
+)
+plugin_setting_toggle_callback_query_handler = lazy_import(
+    ".plugin_setting_toggle_callback_query_handler", __package__
+)
+plugin_settings_callback_query_handler = lazy_import(
+    ".plugin_settings_callback_query_handler", __package__
+)
+remove_plugin_callback_query_handler = lazy_import(
+    ".remove_plugin_callback_query_handler", __package__
+)
+toggle_plugin_callback_query_handler = lazy_import(
+    ".toggle_plugin_callback_query_handler", __package__
+)
 
 
 @controller
 @dataclass
 class PluginCallbackQueryController:
-    list_plugins_handler: ListPluginsCallbackQueryHandler
-    toggle_plugin_handler: TogglePluginCallbackQueryHandler
-    info_plugin_handler: InfoPluginCallbackQueryHandler
-    remove_plugin_handler: RemovePluginCallbackQueryHandler
-    plugin_settings_handler: PluginSettingsCallbackQueryHandler
-    plugin_setting_open_handler: PluginSettingOpenCallbackQueryHandler
-    plugin_setting_select_handler: PluginSettingSelectCallbackQueryHandler
-    plugin_setting_reset_handler: PluginSettingResetCallbackQueryHandler
-    plugin_setting_toggle_handler: PluginSettingToggleCallbackQueryHandler
-    add_plugin_handler: AddPluginCallbackQueryHandler
-    cancel_plugin_handler: CancelPluginCallbackQueryHandler
-    confirm_add_plugin_handler: ConfirmAddPluginCallbackQueryHandler
+    list_plugins_handler: "list_plugins_callback_query_handler.ListPluginsCallbackQueryHandler"
+    toggle_plugin_handler: "toggle_plugin_callback_query_handler.TogglePluginCallbackQueryHandler"
+    info_plugin_handler: "info_plugin_callback_query_handler.InfoPluginCallbackQueryHandler"
+    remove_plugin_handler: "remove_plugin_callback_query_handler.RemovePluginCallbackQueryHandler"
+    plugin_settings_handler: (
+        "plugin_settings_callback_query_handler.PluginSettingsCallbackQueryHandler"
+    )
+    plugin_setting_open_handler: (
+        "plugin_setting_open_callback_query_handler.PluginSettingOpenCallbackQueryHandler"
+    )
+    plugin_setting_select_handler: (
+        "plugin_setting_select_callback_query_handler.PluginSettingSelectCallbackQueryHandler"
+    )
+    plugin_setting_reset_handler: (
+        "plugin_setting_reset_callback_query_handler.PluginSettingResetCallbackQueryHandler"
+    )
+    plugin_setting_toggle_handler: (
+        "plugin_setting_toggle_callback_query_handler.PluginSettingToggleCallbackQueryHandler"
+    )
+    add_plugin_handler: "add_plugin_callback_query_handler.AddPluginCallbackQueryHandler"
+    cancel_plugin_handler: "cancel_plugin_callback_query_handler.CancelPluginCallbackQueryHandler"
+    confirm_add_plugin_handler: (
+        "confirm_add_plugin_callback_query_handler.ConfirmAddPluginCallbackQueryHandler"
+    )
 
     @on_callback_query(filters.regex(r"^info_plugin (?P<basename>.+) (?P<page>\d+)"))
     async def info_plugin(self, _c, callback_query):
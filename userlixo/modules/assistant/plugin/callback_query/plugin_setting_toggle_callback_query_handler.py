@@ -5,7 +5,7 @@ from hydrogram.types import CallbackQuery
 from kink import inject
 
 from userlixo.config import plugins
-from userlixo.database import PluginSetting
+from userlixo.database import repositories
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.modules.assistant.common.plugins import (
     ask_and_handle_plugin_settings,
@@ -50,12 +50,7 @@ class PluginSettingToggleCallbackQueryHandler(CallbackQueryHandler):
             )
 
         setting.value = not setting.value
-        does_exist = PluginSetting.get_or_none(plugin=plugin_name, key=key)
-        if does_exist:
-            does_exist.value = setting.value
-            does_exist.save()
-        else:
-            PluginSetting.create(plugin=plugin_name, key=key, value=setting.value)
+        await repositories.set_plugin_setting(plugin_name, key, setting.value)
 
         await ask_and_handle_plugin_settings(
             client,
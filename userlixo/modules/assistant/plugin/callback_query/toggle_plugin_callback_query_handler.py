@@ -5,8 +5,7 @@ from pathlib import Path
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.config import plugins
-from userlixo.database import Config
+from userlixo.config import config_store, plugins
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.modules.assistant.common.plugins import (
     compose_info_plugin_message,
@@ -36,19 +35,13 @@ class TogglePluginCallbackQueryHandler(CallbackQueryHandler):
 
         inactive = get_inactive_plugins(plugins)
 
-        if deactivate:
-            inactive.append(plugin.name)
-        else:
-            inactive = [x for x in inactive if x != plugin.name]
-
-        inactive = [*set(inactive)]  # make values unique
-        inactive_plugins: Config = Config.get(Config.key == "INACTIVE_PLUGINS")
-        inactive_plugins.update(value=json.dumps(inactive))
+        inactive = inactive | {plugin.name} if deactivate else inactive - {plugin.name}
+        await config_store.set("INACTIVE_PLUGINS", json.dumps(sorted(inactive)))
 
         if deactivate:
             unload_plugin(plugin.name)
         else:
-            load_plugin(plugin.name)
+            await load_plugin(plugin.name)
 
         text = lang.plugin_has_been_deactivated if deactivate else lang.plugin_has_been_activated
         await query.answer(text)
@@ -1,11 +1,3 @@
-from .add_plugin_message_handler import AddPluginMessageHandler
-from .list_plugins_message_handler import ListPluginsMessageHandler
 from .plugin_message_controller import PluginMessageController
-from .process_python_file_message_handler import ProcessPythonFileMessageHandler
 
-__all__ = [
-    "AddPluginMessageHandler",
-    "ListPluginsMessageHandler",
-    "PluginMessageController",
-    "ProcessPythonFileMessageHandler",
-]
+__all__ = ["PluginMessageController"]
@@ -4,20 +4,29 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .add_plugin_message_handler import AddPluginMessageHandler
-from .list_plugins_message_handler import ListPluginsMessageHandler
-from .plugin_settings_controller_message_handler import PluginSettingsMessageHandler
-from .process_python_file_message_handler import ProcessPythonFileMessageHandler
+add_plugin_message_handler = lazy_import(".add_plugin_message_handler", __package__)
+list_plugins_message_handler = lazy_import(".list_plugins_message_handler", __package__)
+plugin_settings_controller_message_handler = lazy_import(
+    ".plugin_settings_controller_message_handler", __package__
+)
+process_python_file_message_handler = lazy_import(
+    ".process_python_file_message_handler", __package__
+)
 
 
 @controller
 @dataclass
 class PluginMessageController:
-    list_plugins_handler: ListPluginsMessageHandler
-    add_plugin_handler: AddPluginMessageHandler
-    process_python_file_handler: ProcessPythonFileMessageHandler
-    plugin_settings_handler: PluginSettingsMessageHandler
+    list_plugins_handler: "list_plugins_message_handler.ListPluginsMessageHandler"
+    add_plugin_handler: "add_plugin_message_handler.AddPluginMessageHandler"
+    process_python_file_handler: (
+        "process_python_file_message_handler.ProcessPythonFileMessageHandler"
+    )
+    plugin_settings_handler: (
+        "plugin_settings_controller_message_handler.PluginSettingsMessageHandler"
+    )
 
     @on_message(filters.document & filters.private & ~filters.me)
     async def handle_plugin(self, client: Client, message: Message):
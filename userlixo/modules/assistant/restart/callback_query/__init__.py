@@ -1,4 +1,3 @@
 from .restart_callback_query_controller import RestartCallbackQueryController
-from .restart_callback_query_handler import RestartCallbackQueryHandler
 
-__all__ = ["RestartCallbackQueryController", "RestartCallbackQueryHandler"]
+__all__ = ["RestartCallbackQueryController"]
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .restart_callback_query_handler import RestartCallbackQueryHandler
+restart_callback_query_handler = lazy_import(".restart_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class RestartCallbackQueryController:
-    handler: RestartCallbackQueryHandler
+    handler: "restart_callback_query_handler.RestartCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^restart"))
     async def on_restart(self, c, callback_query):
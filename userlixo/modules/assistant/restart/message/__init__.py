@@ -1,4 +1,3 @@
 from .restart_message_controller import RestartMessageController
-from .restart_message_handler import RestartMessageHandler
 
-__all__ = ["RestartMessageController", "RestartMessageHandler"]
+__all__ = ["RestartMessageController"]
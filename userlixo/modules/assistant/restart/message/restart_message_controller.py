@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .restart_message_handler import RestartMessageHandler
+restart_message_handler = lazy_import(".restart_message_handler", __package__)
 
 
 @controller
 @dataclass
 class RestartMessageController:
-    handler: RestartMessageHandler
+    handler: "restart_message_handler.RestartMessageHandler"
 
     @on_message(filters.regex("^/(start )?restart"))
     async def restart(self, client: Client, message):
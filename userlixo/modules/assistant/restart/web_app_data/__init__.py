@@ -1,4 +1,3 @@
 from .restart_web_app_data_controller import RestartWebAppDataController
-from .restart_web_app_data_handler import RestartWebAppDataHandler
 
-__all__ = ["RestartWebAppDataController", "RestartWebAppDataHandler"]
+__all__ = ["RestartWebAppDataController"]
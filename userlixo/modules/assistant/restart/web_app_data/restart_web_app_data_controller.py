@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .restart_web_app_data_handler import RestartWebAppDataHandler
+restart_web_app_data_handler = lazy_import(".restart_web_app_data_handler", __package__)
 
 
 @controller
 @dataclass
 class RestartWebAppDataController:
-    handler: RestartWebAppDataHandler
+    handler: "restart_web_app_data_handler.RestartWebAppDataHandler"
 
     @on_message(filters.web_data_cmd("restart"))
     async def restart(self, client: Client, message):
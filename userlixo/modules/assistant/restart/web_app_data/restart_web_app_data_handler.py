@@ -23,6 +23,6 @@ class RestartWebAppDataHandler(WebAppDataHandler):
         text = compose_before_restart_message(lang)
         msg = await m.reply(text)
 
-        save_before_restart_message_info(msg.id, msg.chat.id, "bot")
+        await save_before_restart_message_info(msg.id, msg.chat.id, "bot")
 
         self_restart_process()
@@ -1,4 +1,3 @@
 from .settings_callback_query_controller import SettingsCallbackQueryController
-from .settings_callback_query_handler import SettingsCallbackQueryHandler
 
-__all__ = ["SettingsCallbackQueryController", "SettingsCallbackQueryHandler"]
+__all__ = ["SettingsCallbackQueryController"]
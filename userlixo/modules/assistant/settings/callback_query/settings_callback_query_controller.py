@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .settings_callback_query_handler import SettingsCallbackQueryHandler
+settings_callback_query_handler = lazy_import(".settings_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class SettingsCallbackQueryController:
-    handler: SettingsCallbackQueryHandler
+    handler: "settings_callback_query_handler.SettingsCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^settings"))
     async def settings(self, client: Client, query):
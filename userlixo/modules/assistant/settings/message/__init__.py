@@ -1,4 +1,3 @@
 from .settings_message_controller import SettingsMessageController
-from .settings_message_handler import SettingsMessageHandler
 
-__all__ = ["SettingsMessageController", "SettingsMessageHandler"]
+__all__ = ["SettingsMessageController"]
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .settings_message_handler import SettingsMessageHandler
+settings_message_handler = lazy_import(".settings_message_handler", __package__)
 
 
 @controller
 @dataclass
 class SettingsMessageController:
-    handler: SettingsMessageHandler
+    handler: "settings_message_handler.SettingsMessageHandler"
 
     @on_message(filters.regex("^/(start )?settings"))
     async def settings(self, client: Client, message):
@@ -1,4 +1,3 @@
 from .save_settings_web_app_data_controller import SaveSettingsWebAppDataController
-from .save_settings_web_app_data_handler import SaveSettingsWebAppDataHandler
 
-__all__ = ["SaveSettingsWebAppDataController", "SaveSettingsWebAppDataHandler"]
+__all__ = ["SaveSettingsWebAppDataController"]
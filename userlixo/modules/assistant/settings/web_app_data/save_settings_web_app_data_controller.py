@@ -3,14 +3,17 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .save_settings_web_app_data_handler import SaveSettingsWebAppDataHandler
+save_settings_web_app_data_handler = lazy_import(
+    ".save_settings_web_app_data_handler", __package__
+)
 
 
 @controller
 @dataclass
 class SaveSettingsWebAppDataController:
-    handler: SaveSettingsWebAppDataHandler
+    handler: "save_settings_web_app_data_handler.SaveSettingsWebAppDataHandler"
 
     @on_message(filters.web_data_cmd("save_settings"))
     async def save_settings(self, client: Client, message):
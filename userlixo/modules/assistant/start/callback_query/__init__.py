@@ -1,4 +1,3 @@
 from .start_callback_query_controller import StartCallbackQueryController
-from .start_callback_query_handler import StartCallbackQueryHandler
 
-__all__ = ["StartCallbackQueryController", "StartCallbackQueryHandler"]
+__all__ = ["StartCallbackQueryController"]
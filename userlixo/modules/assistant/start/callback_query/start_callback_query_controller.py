@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .start_callback_query_handler import StartCallbackQueryHandler
+start_callback_query_handler = lazy_import(".start_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class StartCallbackQueryController:
-    handler: StartCallbackQueryHandler
+    handler: "start_callback_query_handler.StartCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^start"))
     async def start(self, *args):
@@ -1,4 +1,3 @@
 from .start_message_controller import StartMessageController
-from .start_message_handler import StartMessageHandler
 
-__all__ = ["StartMessageController", "StartMessageHandler"]
+__all__ = ["StartMessageController"]
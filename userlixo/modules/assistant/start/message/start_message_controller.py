@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .start_message_handler import StartMessageHandler
+start_message_handler = lazy_import(".start_message_handler", __package__)
 
 
 @controller
 @dataclass
 class StartMessageController:
-    handler: StartMessageHandler
+    handler: "start_message_handler.StartMessageHandler"
 
     @on_message(filters.regex("^/start$"))
     async def handle_message(self, *args):
@@ -1,9 +1,3 @@
-from .remove_sudoer_callback_query_handler import RemoveSudoerCallbackQueryHandler
-from .setting_sudoers_callback_query_handler import SettingSudoersCallbackQueryHandler
 from .sudoer_callback_query_controller import SudoerCallbackQueryController
 
-__all__ = [
-    "RemoveSudoerCallbackQueryHandler",
-    "SettingSudoersCallbackQueryHandler",
-    "SudoerCallbackQueryController",
-]
+__all__ = ["SudoerCallbackQueryController"]
@@ -1,16 +1,13 @@
-import os
 from dataclasses import dataclass
 
 from hydrogram.types import CallbackQuery
 from kink import inject
 
-from userlixo.config import sudoers
-from userlixo.database import Config
+from userlixo.config import sudoer_registry
 from userlixo.modules.abstract import CallbackQueryHandler
 from userlixo.modules.assistant.common.sudoers import (
     compose_list_sudoers_message,
 )
-from userlixo.utils import tryint
 from userlixo.utils.services.language_selector import LanguageSelector
 
 
@@ -22,17 +19,10 @@ class RemoveSudoerCallbackQueryHandler(CallbackQueryHandler):
     async def handle_callback_query(self, _client, query: CallbackQuery):
         lang = self.language_selector.get_lang()
 
-        who = tryint(query.matches[0].group("who"))
+        who = query.matches[0].group("who")
 
-        # Sanitize list
-        sudoers[:] = [*map(tryint, sudoers)]
-        removed = [x for x in sudoers if x != who]
-        sudoers[:] = removed
-
-        Config.update(value=" ".join([*map(str, sudoers)])).where(
-            Config.key == "SUDOERS_LIST"
-        ).execute()
-        os.environ["SUDOERS_LIST"] = " ".join([*map(str, sudoers)])
+        sudoer_registry.remove(who)
+        await sudoer_registry.save()
 
         text, keyboard = await compose_list_sudoers_message(
             lang, _client, from_user_id=query.from_user.id
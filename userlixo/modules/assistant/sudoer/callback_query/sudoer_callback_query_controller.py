@@ -3,16 +3,23 @@ from dataclasses import dataclass
 from hydrogram import filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .remove_sudoer_callback_query_handler import RemoveSudoerCallbackQueryHandler
-from .setting_sudoers_callback_query_handler import SettingSudoersCallbackQueryHandler
+remove_sudoer_callback_query_handler = lazy_import(
+    ".remove_sudoer_callback_query_handler", __package__
+)
+setting_sudoers_callback_query_handler = lazy_import(
+    ".setting_sudoers_callback_query_handler", __package__
+)
 
 
 @controller
 @dataclass
 class SudoerCallbackQueryController:
-    setting_sudoers_handler: SettingSudoersCallbackQueryHandler
-    remove_sudoer_handler: RemoveSudoerCallbackQueryHandler
+    setting_sudoers_handler: (
+        "setting_sudoers_callback_query_handler.SettingSudoersCallbackQueryHandler"
+    )
+    remove_sudoer_handler: "remove_sudoer_callback_query_handler.RemoveSudoerCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^setting_sudoers"))
     async def setting_sudoers(self, _c, callback_query):
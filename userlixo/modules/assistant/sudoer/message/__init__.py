@@ -1,4 +1,3 @@
 from .add_sudoer_message_controller import AddSudoerMessageController
-from .add_sudoer_message_handler import AddSudoerMessageHandler
 
-__all__ = ["AddSudoerMessageController", "AddSudoerMessageHandler"]
+__all__ = ["AddSudoerMessageController"]
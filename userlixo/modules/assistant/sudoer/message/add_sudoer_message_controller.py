@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .add_sudoer_message_handler import AddSudoerMessageHandler
+add_sudoer_message_handler = lazy_import(".add_sudoer_message_handler", __package__)
 
 
 @controller
 @dataclass
 class AddSudoerMessageController:
-    handler: AddSudoerMessageHandler
+    handler: "add_sudoer_message_handler.AddSudoerMessageHandler"
 
     @on_message(filters.regex("^/(start )?add_sudoer"))
     async def add_sudoer(self, client: Client, message):
@@ -6,8 +6,7 @@ from hydrogram.helpers import force_reply, ikb
 from hydrogram.types import Message
 from kink import inject
 
-from userlixo.config import sudoers, user
-from userlixo.database import Config
+from userlixo.config import sudoer_registry, user
 from userlixo.modules.abstract import MessageHandler
 from userlixo.utils.services.language_selector import LanguageSelector
 
@@ -26,14 +25,11 @@ class AddSudoerMessageHandler(MessageHandler):
         if not re.match(r"@?\w+$", response.text):
             return await m.reply(lang.add_sudoer_not_match)
 
-        sudoers_str: str = Config.get(Config.key == "SUDOERS_LIST").value
-        sudoers_list = sudoers_str.split(" ")
-        sudoers_list.append(response.text.lstrip("@"))
-        sudoers[:] = [user.me.id, *sudoers_list]
-        Config.update(value=" ".join(map(str, sudoers_list))).where(
-            Config.key == "SUDOERS_LIST"
-        ).execute()
+        sudoer_registry.add(response.text)
+        await sudoer_registry.save()
 
         keyboard = ikb([[(lang.back, "setting_sudoers")]])
         await m.reply(lang.sudoer_added, keyboard)
+
+        await sudoer_registry.resolve_usernames(user)
         return None
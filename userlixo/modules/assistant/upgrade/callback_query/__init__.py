@@ -1,4 +1,3 @@
 from .upgrade_callback_query_controller import UpgradeCallbackQueryController
-from .upgrade_callback_query_handler import UpgradeCallbackQueryHandler
 
-__all__ = ["UpgradeCallbackQueryController", "UpgradeCallbackQueryHandler"]
+__all__ = ["UpgradeCallbackQueryController"]
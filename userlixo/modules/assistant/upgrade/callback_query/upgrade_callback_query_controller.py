@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_callback_query
+from userlixo.utils.lazy import lazy_import
 
-from .upgrade_callback_query_handler import UpgradeCallbackQueryHandler
+upgrade_callback_query_handler = lazy_import(".upgrade_callback_query_handler", __package__)
 
 
 @controller
 @dataclass
 class UpgradeCallbackQueryController:
-    handler: UpgradeCallbackQueryHandler
+    handler: "upgrade_callback_query_handler.UpgradeCallbackQueryHandler"
 
     @on_callback_query(filters.regex("^upgrade"))
     async def upgrade(self, client: Client, query):
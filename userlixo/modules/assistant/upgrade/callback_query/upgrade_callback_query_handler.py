@@ -36,7 +36,7 @@ class UpgradeCallbackQueryHandler(CallbackQueryHandler):
                 chat_id = query.message.chat.id
                 message_id = query.message.id
 
-            save_before_restart_message_info(message_id, chat_id, "bot")
+            await save_before_restart_message_info(message_id, chat_id, "bot")
             await edit_message(text)
 
         await (
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .upgrade_message_handler import UpgradeMessageHandler
+upgrade_message_handler = lazy_import(".upgrade_message_handler", __package__)
 
 
 @controller
 @dataclass
 class UpgradeMessageController:
-    handler: UpgradeMessageHandler
+    handler: "upgrade_message_handler.UpgradeMessageHandler"
 
     @on_message(filters.regex("^/(start )?upgrade"))
     async def upgrade(self, client: Client, message):
@@ -1,4 +1,3 @@
 from .upgrade_web_app_data_controller import UpgradeWebAppDataController
-from .upgrade_web_app_data_handler import UpgradeWebAppDataHandler
 
-__all__ = ["UpgradeWebAppDataController", "UpgradeWebAppDataHandler"]
+__all__ = ["UpgradeWebAppDataController"]
@@ -3,14 +3,15 @@ from dataclasses import dataclass
 from hydrogram import Client, filters
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .upgrade_web_app_data_handler import UpgradeWebAppDataHandler
+upgrade_web_app_data_handler = lazy_import(".upgrade_web_app_data_handler", __package__)
 
 
 @controller
 @dataclass
 class UpgradeWebAppDataController:
-    handler: UpgradeWebAppDataHandler
+    handler: "upgrade_web_app_data_handler.UpgradeWebAppDataHandler"
 
     @on_message(filters.web_data_cmd("upgrade"))
     async def upgrade(self, client: Client, message):
@@ -26,7 +26,7 @@ class UpgradeWebAppDataHandler(WebAppDataHandler):
             chat_id = msg.chat.id
             message_id = msg.id
 
-            save_before_restart_message_info(message_id, chat_id, "bot")
+            await save_before_restart_message_info(message_id, chat_id, "bot")
 
         await (
             UpgradeLogicBuilder.set_lang(lang)
@@ -1,4 +1,3 @@
 from .web_app_message_controller import WebAppMessageController
-from .web_app_message_handler import WebAppMessageHandler
 
-__all__ = ["WebAppMessageController", "WebAppMessageHandler"]
+__all__ = ["WebAppMessageController"]
@@ -4,14 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
 
-from .web_app_message_handler import WebAppMessageHandler
+web_app_message_handler = lazy_import(".web_app_message_handler", __package__)
 
 
 @controller
 @dataclass
 class WebAppMessageController:
-    handler: WebAppMessageHandler
+    handler: "web_app_message_handler.WebAppMessageHandler"
 
     @on_message(filters.regex("^/(start )?webapp"))
     async def webapp(self, client: Client, message: Message):
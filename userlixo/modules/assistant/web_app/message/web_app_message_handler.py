@@ -3,14 +3,12 @@ import os
 import urllib
 from dataclasses import dataclass
 
-import psutil
 from hydrogram.helpers import kb
 from hydrogram.types import Message, WebAppInfo
 from kink import inject
 
-from userlixo.config import cmds, plugins, user
+from userlixo.config import cmds, plugins, repo_info, system_info, update_checker, user
 from userlixo.modules.abstract import MessageHandler
-from userlixo.utils import shell_exec
 from userlixo.utils.services.language_selector import LanguageSelector
 
 
@@ -21,15 +19,13 @@ class WebAppMessageHandler(MessageHandler):
 
     @staticmethod
     async def handle_message(_c, m: Message):
-        local_version = int((await shell_exec("git rev-list --count HEAD"))[0])
-        p = psutil.Process(os.getpid())
-        start_time = p.create_time()
-
+        local_version = (await repo_info.get_commit()).count
         info = await user.get_me()
 
         info_json = json.dumps({
             "version": local_version,
-            "start_time": start_time,
+            "remote_version": update_checker.get_remote_version(),
+            "start_time": system_info.started_at,
             "name": info.full_name,
             "id": info.id,
             "picture": f"https://t.me/i/userpic/160/{info.username}.jpg",
@@ -5,7 +5,10 @@ from collections.abc import Callable
 
 from hydrogram import Client
 from hydrogram.types import Message
-from meval import meval
+
+from userlixo.utils.lazy import lazy_import
+
+meval = lazy_import("meval")
 
 
 async def evals(  # noqa: PLR0917
@@ -25,7 +28,7 @@ async def evals(  # noqa: PLR0917
     chat = message.chat
 
     try:
-        output = await meval(eval_code, globals(), **locals())
+        output = await meval.meval(eval_code, globals(), **locals())
     except BaseException:
         traceback_string = traceback.format_exc()
         text = f"Exception while running the code:\n<pre>{traceback_string}</pre>"
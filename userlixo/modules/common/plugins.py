@@ -1,3 +1,4 @@
+import html
 import os
 import re
 
@@ -11,9 +12,11 @@ from userlixo.config import bot, plugins
 from userlixo.types.plugin_info import PluginInfo
 from userlixo.utils.plugins import (
     InvalidPluginInfoValueError,
+    find_plugin_conflicts,
     get_inactive_plugins,
     get_plugin_info_from_zip,
 )
+from userlixo.utils.requirements_resolver import RequirementConflict
 
 
 def compose_list_plugins_message(
@@ -95,6 +98,18 @@ def compose_plugin_info_text(lang, info: PluginInfo, **kwargs):
     return "\n".join(filter(lambda x: x is not None, lines))
 
 
+def compose_add_plugin_text(
+    lang: Langs, info: PluginInfo, conflicts: list[RequirementConflict]
+) -> str:
+    text = compose_plugin_info_text(lang, info, status_line="")
+    if not conflicts:
+        return text
+
+    # compose_plugin_info_text turns off escaping and requirements have "<" in them
+    conflicts_text = html.escape("\n".join(map(str, conflicts)))
+    return f"{text}\n\n{lang.plugin_requirements_conflict(conflicts=conflicts_text)}"
+
+
 async def handle_add_plugin_request(lang: Langs, client: Client, update: Message | CallbackQuery):
     is_query = isinstance(update, CallbackQuery)
     loop_count = 0
@@ -120,6 +135,8 @@ async def handle_add_plugin_request(lang: Langs, client: Client, update: Message
 
         try:
             plugin_info = get_plugin_info_from_zip(filename)
+            # Checked before installing anything, against the plugins already installed
+            conflicts = find_plugin_conflicts(plugin_info) if plugin_info else []
         except InvalidPluginInfoValueError as e:
             return await msg.reply(
                 lang.plugin_invalid_info_value_error(errors="\n".join(e.args[0]))
@@ -129,7 +146,7 @@ async def handle_add_plugin_request(lang: Langs, client: Client, update: Message
             return await msg.reply(lang.plugin_info_block_not_found)
 
         # Showing info
-        text = compose_plugin_info_text(lang, plugin_info, status_line="")
+        text = compose_add_plugin_text(lang, plugin_info, conflicts)
         lines = [
             [
                 (lang.add, f"confirm_add_plugin {filename}"),
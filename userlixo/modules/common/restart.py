@@ -5,24 +5,20 @@ from typing import Literal
 
 from langs import Langs
 
-from userlixo.database import Config
+from userlixo.config import config_store
 
 
 def compose_before_restart_message(lang: Langs):
     return lang.restarting_now_alert
 
 
-def save_before_restart_message_info(
+async def save_before_restart_message_info(
     message_id: int, chat_id: int, from_client: Literal["bot", "user"]
 ):
-    query = Config.delete().where(Config.key == "restarting_alert")
-    query.execute()
-
     timestamp = datetime.now(tz=UTC).timestamp()
 
-    Config.create(
-        key="restarting_alert",
-        value=f"{message_id}|{chat_id}|{timestamp}|restart{from_client}",
+    await config_store.set(
+        "restarting_alert", f"{message_id}|{chat_id}|{timestamp}|restart{from_client}"
     )
 
 
@@ -32,5 +28,7 @@ def self_restart_process():
         args.append("--no-update")
     if "--no-clear" in sys.argv:
         args.append("--no-clear")
+    if "--profile-startup" in sys.argv:
+        args.append("--profile-startup")
 
     os.execv(sys.executable, args)
@@ -1,12 +1,11 @@
 from collections.abc import Callable
 from datetime import UTC, datetime
-from pathlib import Path
 
 from langs import Langs
 
-from userlixo.database import Config
+from userlixo.config import config_store, repo_info, update_checker
 from userlixo.modules.common.restart import self_restart_process
-from userlixo.utils.misc import shell_exec, timezone_shortener
+from userlixo.utils.misc import shell_exec
 
 
 class UpgradeLogicBuilder:
@@ -39,7 +38,7 @@ class UpgradeLogicBuilder:
     async def execute(cls):
         lang = cls.lang
 
-        current_branch = get_branch_if_is_git()
+        current_branch = repo_info.get_branch()
         if not current_branch:
             text = compose_not_git_error_message(lang)
             return await cls._on_error(text) if callable(cls._on_error) else None
@@ -52,16 +51,13 @@ class UpgradeLogicBuilder:
             return await cls._on_error(text) if callable(cls._on_error) else None
 
         if "Your branch is up to date" in stdout:
-            revision = await get_current_commit_short_revision()
-            date = await get_current_commit_date()
+            commit = await repo_info.get_commit()
+            # git just fetched the remote, no need for the checker to ask again
+            update_checker.record(commit.count)
 
-            timezone = await get_current_commit_timezone()
-            timezone = timezone_shortener(timezone)
-            date += f" ({timezone})"
-
-            commits_count = await get_current_commits_count()
-
-            text = compose_already_uptodate_message(lang, revision, date, commits_count)
+            text = compose_already_uptodate_message(
+                lang, commit.short_sha, commit.date_with_timezone, commit.count
+            )
             return await cls._on_exception(text) if callable(cls._on_exception) else None
 
         stdout, process = await git_pull_from_branch(current_branch)
@@ -96,22 +92,6 @@ def compose_already_uptodate_message(lang: Langs, rev: str, date: str, local_ver
     return lang.upgrade_alert_already_uptodate(rev=rev, date=date, local_version=local_version)
 
 
-def get_branch_if_is_git():
-    try:
-        head_file = Path(".git/HEAD")
-    except FileNotFoundError:
-        return None
-
-    with head_file.open(encoding="utf-8") as f:
-        content = f.read().splitlines()
-
-    for line in content:
-        if line.startswith("ref:"):
-            return line.partition("refs/heads/")[2].strip()
-
-    return None
-
-
 async def get_git_status():
     stdout, process = await shell_exec("git fetch && git status -uno")
 
@@ -122,37 +102,15 @@ async def git_merge_abort():
     await shell_exec("git merge --abort")
 
 
-async def get_current_commit_short_revision():
-    return (await shell_exec("git rev-parse --short HEAD"))[0]
-
-
-async def get_current_commit_date():
-    return (await shell_exec('git log -1 --format=%cd --date=format:"%d/%m %H:%M"'))[0]
-
-
-async def get_current_commit_timezone():
-    return (await shell_exec('git log -1 --format=%cd --date=format:"%z"'))[0]
-
-
-async def get_current_commits_count():
-    commits_count = (await shell_exec("git rev-list --count HEAD"))[0]
-
-    return int(commits_count)
-
-
 async def git_pull_from_branch(branch: str):
     stdout, process = await shell_exec(f"git pull --no-edit origin {branch}")
 
     return stdout, process
 
 
-def save_before_upgrade_message_info(message_id: int, chat_id: int, from_client: str):
-    query = Config.delete().where(Config.key == "restarting_alert")
-    query.execute()
-
+async def save_before_upgrade_message_info(message_id: int, chat_id: int, from_client: str):
     timestamp = datetime.now(tz=UTC).timestamp()
 
-    Config.create(
-        key="restarting_alert",
-        value=f"{message_id}|{chat_id}|{timestamp}|upgrade{from_client}",
+    await config_store.set(
+        "restarting_alert", f"{message_id}|{chat_id}|{timestamp}|upgrade{from_client}"
     )
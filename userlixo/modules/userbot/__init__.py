@@ -5,6 +5,7 @@ from .execs import ExecsController
 from .help import HelpController
 from .info import InfoController
 from .list_commands import ListCommandsController
+from .metrics import MetricsController
 from .ping import PingController
 from .plugin import PluginController
 from .restart import RestartController
@@ -20,6 +21,7 @@ from .upgrade import UpgradeController
         HelpController,
         InfoController,
         ListCommandsController,
+        MetricsController,
         PingController,
         PluginController,
         RestartController,
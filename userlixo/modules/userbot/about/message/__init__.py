@@ -1,4 +1,3 @@
 from .about_message_controller import AboutMessageController
-from .about_message_handler import AboutMessageHandler
 
-__all__ = ["AboutMessageController", "AboutMessageHandler"]
+__all__ = ["AboutMessageController"]
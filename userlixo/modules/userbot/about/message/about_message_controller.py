@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.about.message.about_message_handler import (
-    AboutMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+about_message_handler = lazy_import(".about_message_handler", __package__)
 
 
 @controller
 @dataclass
 class AboutMessageController:
-    handler: AboutMessageHandler
+    handler: "about_message_handler.AboutMessageHandler"
 
     @on_message(filters.su_cmd("about"))
     async def about(self, client: Client, message: Message):
@@ -1,11 +1,3 @@
-from .cmd_message_handler import CmdMessageHandler
-from .eval_message_handler import EvalMessageHandler
-from .exec_message_handler import ExecMessageHandler
 from .execs_message_controller import ExecsMessageController
 
-__all__ = [
-    "CmdMessageHandler",
-    "EvalMessageHandler",
-    "ExecMessageHandler",
-    "ExecsMessageController",
-]
+__all__ = ["ExecsMessageController"]
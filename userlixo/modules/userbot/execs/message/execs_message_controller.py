@@ -5,23 +5,19 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.execs.message.cmd_message_handler import (
-    CmdMessageHandler,
-)
-from userlixo.modules.userbot.execs.message.eval_message_handler import (
-    EvalMessageHandler,
-)
-from userlixo.modules.userbot.execs.message.exec_message_handler import (
-    ExecMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+cmd_message_handler = lazy_import(".cmd_message_handler", __package__)
+eval_message_handler = lazy_import(".eval_message_handler", __package__)
+exec_message_handler = lazy_import(".exec_message_handler", __package__)
 
 
 @controller
 @dataclass
 class ExecsMessageController:
-    cmd_handler: CmdMessageHandler
-    eval_handler: EvalMessageHandler
-    exec_handler: ExecMessageHandler
+    cmd_handler: "cmd_message_handler.CmdMessageHandler"
+    eval_handler: "eval_message_handler.EvalMessageHandler"
+    exec_handler: "exec_message_handler.ExecMessageHandler"
 
     @on_message(filters.su_cmd(r"(?P<command>cmd|sh)\s+(?P<code>.+)", flags=re.DOTALL))
     async def cmd(self, client: Client, message: Message):
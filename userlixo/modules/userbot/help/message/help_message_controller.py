@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.help.message.help_message_handler import (
-    HelpMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+help_message_handler = lazy_import(".help_message_handler", __package__)
 
 
 @controller
 @dataclass
 class HelpMessageController:
-    handler: HelpMessageHandler
+    handler: "help_message_handler.HelpMessageHandler"
 
     @on_message(filters.su_cmd("help"))
     async def help(self, client: Client, message: Message):
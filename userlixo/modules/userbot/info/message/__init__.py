@@ -1,4 +1,3 @@
 from .info_message_controller import InfoMessageController
-from .info_message_handler import InfoMessageHandler
 
-__all__ = ["InfoMessageController", "InfoMessageHandler"]
+__all__ = ["InfoMessageController"]
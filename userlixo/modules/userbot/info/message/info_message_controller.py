@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.info.message.info_message_handler import (
-    InfoMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+info_message_handler = lazy_import(".info_message_handler", __package__)
 
 
 @controller
 @dataclass
 class InfoMessageController:
-    handler: InfoMessageHandler
+    handler: "info_message_handler.InfoMessageHandler"
 
     @on_message(filters.su_cmd("info"))
     async def info(self, client: Client, message: Message):
@@ -1,19 +1,13 @@
-import datetime
-import os
-import platform
-import time
 from dataclasses import dataclass
 
-import hydrogram
-import psutil
 from hydrogram import Client, filters
 from hydrogram.types import Message
 from kink import inject
 
-from userlixo.config import plugins
+from userlixo.config import plugins, repo_info, system_info, update_checker
 from userlixo.modules.abstract import MessageHandler
-from userlixo.utils import shell_exec
 from userlixo.utils.services.language_selector import LanguageSelector
+from userlixo.utils.services.system_info import format_bytes
 
 
 @inject
@@ -26,28 +20,9 @@ class InfoMessageHandler(MessageHandler):
 
         act = message.edit if filters.me(client, message) else message.reply
 
-        pid = os.getpid()
-        p = psutil.Process(pid)
-        start_time = p.create_time()
-        now_time = time.time()
-        uptime = datetime.timedelta(seconds=int(now_time - start_time))
-
-        uname = (await shell_exec("uname -mons"))[0]
-        local_version = int((await shell_exec("git rev-list --count HEAD"))[0])
-        try:
-            remote_version = int(
-                (
-                    await shell_exec(
-                        "curl -s -I -k 'https://api.github.com/repos/AmanoTeam/UserLixo/commits?per_page=1'"
-                        + "| grep -oE '&page=[0-9]+>; rel=\"last\"' | grep -oE '[0-9]+' "
-                    )
-                )[0]
-            )
-        except ValueError:
-            remote_version = "???"
-
-        python_version = platform.python_version()
-        hydrogram_version = hydrogram.__version__
+        stats = system_info.get_stats()
+        local_version = (await repo_info.get_commit()).count
+        remote_version = update_checker.get_remote_version()
 
         ul_status = (
             (
@@ -55,20 +30,24 @@ class InfoMessageHandler(MessageHandler):
                 if local_version < remote_version
                 else lang.info_latest
             )
-            if remote_version is int
+            if remote_version is not None
             else lang.unknown
         )
 
         plugins_total = len(plugins)
 
         text = lang.info_text(
-            pid=pid,
-            uptime=uptime,
-            uname=uname,
+            pid=system_info.pid,
+            uptime=stats.uptime,
+            memory=format_bytes(stats.rss),
+            cpu_percent=stats.cpu_percent,
+            threads=stats.threads,
+            open_fds="?" if stats.open_fds is None else stats.open_fds,
+            uname=system_info.uname,
             local_version=local_version,
             ul_status=ul_status,
-            python_version=python_version,
-            hydrogram_version=hydrogram_version,
+            python_version=system_info.python_version,
+            hydrogram_version=system_info.hydrogram_version,
             plugins_total=plugins_total,
         )
         await act(text)
@@ -1,4 +1,3 @@
 from .list_commands_message_controller import ListCommandsMessageController
-from .list_commands_message_handler import ListCommandsMessageHandler
 
-__all__ = ["ListCommandsMessageController", "ListCommandsMessageHandler"]
+__all__ = ["ListCommandsMessageController"]
@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.list_commands.message.list_commands_message_handler import (
-    ListCommandsMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+list_commands_message_handler = lazy_import(".list_commands_message_handler", __package__)
 
 
 @controller
 @dataclass
 class ListCommandsMessageController:
-    handler: ListCommandsMessageHandler
+    handler: "list_commands_message_handler.ListCommandsMessageHandler"
 
     @on_message(filters.su_cmd("(commands|cmds)"))
     async def list_commands(self, client: Client, message: Message):
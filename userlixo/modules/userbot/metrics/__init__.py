@@ -0,0 +1,8 @@
+from userlixo.decorators import controller
+
+from .message import MetricsMessageController
+
+
+@controller(imports=[MetricsMessageController])
+class MetricsController:
+    pass
@@ -0,0 +1,3 @@
+from .metrics_message_controller import MetricsMessageController
+
+__all__ = ["MetricsMessageController"]
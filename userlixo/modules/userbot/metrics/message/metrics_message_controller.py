@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from hydrogram import Client, filters
+from hydrogram.types import Message
+
+from userlixo.decorators import controller, on_message
+from userlixo.utils.lazy import lazy_import
+
+metrics_message_handler = lazy_import(".metrics_message_handler", __package__)
+
+
+@controller
+@dataclass
+class MetricsMessageController:
+    handler: "metrics_message_handler.MetricsMessageHandler"
+
+    @on_message(filters.su_cmd("metrics"))
+    async def metrics(self, client: Client, message: Message):
+        await self.handler.handle_message(client, message)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from hydrogram import Client, filters
+from hydrogram.types import Message
+from kink import inject
+
+from userlixo.modules.abstract import MessageHandler
+from userlixo.utils.services.handler_metrics import HandlerMetrics, HandlerStatsSnapshot
+from userlixo.utils.services.language_selector import LanguageSelector
+
+# The slowest handlers by total time, so the message stays within Telegram's limit
+MAX_HANDLERS = 15
+
+
+def format_snapshot(snapshot: HandlerStatsSnapshot) -> str:
+    name = f"{snapshot.name} ({snapshot.plugin})" if snapshot.plugin else snapshot.name
+    return (
+        f"{name}\n"
+        f"  {snapshot.calls} calls, {snapshot.errors} errors, mean {snapshot.mean_ms:.1f}ms\n"
+        f"  p50 ≤{snapshot.p50_ms:g}ms, p95 ≤{snapshot.p95_ms:g}ms, p99 ≤{snapshot.p99_ms:g}ms"
+    )
+
+
+@inject
+@dataclass
+class MetricsMessageHandler(MessageHandler):
+    language_selector: LanguageSelector
+    handler_metrics: HandlerMetrics
+
+    async def handle_message(self, client: Client, message: Message):
+        lang = self.language_selector.get_lang()
+
+        act = message.edit if filters.me(client, message) else message.reply
+
+        if not self.handler_metrics.enabled:
+            await act(lang.handler_metrics_disabled)
+            return
+
+        snapshots = [s for s in self.handler_metrics.snapshot() if s.calls][:MAX_HANDLERS]
+        if not snapshots:
+            await act(lang.handler_metrics_empty)
+            return
+
+        report = "\n\n".join(format_snapshot(snapshot) for snapshot in snapshots)
+        await act(lang.handler_metrics_text(report=report))
@@ -1,4 +1,3 @@
 from .ping_message_controller import PingMessageController
-from .ping_message_handler import PingMessageHandler
 
-__all__ = ["PingMessageController", "PingMessageHandler"]
+__all__ = ["PingMessageController"]
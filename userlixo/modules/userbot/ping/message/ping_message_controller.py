@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.ping.message.ping_message_handler import (
-    PingMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+ping_message_handler = lazy_import(".ping_message_handler", __package__)
 
 
 @controller
 @dataclass
 class PingMessageController:
-    handler: PingMessageHandler
+    handler: "ping_message_handler.PingMessageHandler"
 
     @on_message(filters.su_cmd("ping"))
     async def ping(self, client: Client, message: Message):
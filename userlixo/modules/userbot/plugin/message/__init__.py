@@ -1,11 +1,3 @@
-from .list_plugins_message_handler import ListPluginsMessageHandler
-from .plugin_action_message_handler import PluginActionMessageHandler
 from .plugin_message_controller import PluginMessageController
-from .process_python_file_message_handler import ProcessPythonFileMessageHandler
 
-__all__ = [
-    "ListPluginsMessageHandler",
-    "PluginActionMessageHandler",
-    "PluginMessageController",
-    "ProcessPythonFileMessageHandler",
-]
+__all__ = ["PluginMessageController"]
@@ -4,23 +4,23 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.plugin.message.list_plugins_message_handler import (
-    ListPluginsMessageHandler,
-)
-from userlixo.modules.userbot.plugin.message.plugin_action_message_handler import (
-    PluginActionMessageHandler,
-)
-from userlixo.modules.userbot.plugin.message.process_python_file_message_handler import (
-    ProcessPythonFileMessageHandler,
+from userlixo.utils.lazy import lazy_import
+
+list_plugins_message_handler = lazy_import(".list_plugins_message_handler", __package__)
+plugin_action_message_handler = lazy_import(".plugin_action_message_handler", __package__)
+process_python_file_message_handler = lazy_import(
+    ".process_python_file_message_handler", __package__
 )
 
 
 @controller
 @dataclass
 class PluginMessageController:
-    plugin_action_handler: PluginActionMessageHandler
-    process_python_file_handler: ProcessPythonFileMessageHandler
-    list_plugins_handler: ListPluginsMessageHandler
+    plugin_action_handler: "plugin_action_message_handler.PluginActionMessageHandler"
+    process_python_file_handler: (
+        "process_python_file_message_handler.ProcessPythonFileMessageHandler"
+    )
+    list_plugins_handler: "list_plugins_message_handler.ListPluginsMessageHandler"
 
     @on_message(filters.reply & filters.su_cmd(r"(plugin )?(?P<action>add|rm|\+|-)"))
     async def plugin_action(self, client: Client, message: Message):
@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.restart.message.restart_message_handler import (
-    RestartMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+restart_message_handler = lazy_import(".restart_message_handler", __package__)
 
 
 @controller
 @dataclass
 class RestartMessageController:
-    handler: RestartMessageHandler
+    handler: "restart_message_handler.RestartMessageHandler"
 
     @on_message(filters.su_cmd("restart"))
     async def restart(self, client: Client, message: Message):
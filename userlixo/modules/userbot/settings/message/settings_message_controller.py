@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.settings.message.settings_message_handler import (
-    SettingsMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+settings_message_handler = lazy_import(".settings_message_handler", __package__)
 
 
 @controller
 @dataclass
 class SettingsMessageController:
-    handler: SettingsMessageHandler
+    handler: "settings_message_handler.SettingsMessageHandler"
 
     @on_message(filters.su_cmd("settings"))
     async def settings(self, client: Client, message: Message):
@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.start.message.start_message_handler import (
-    StartMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+start_message_handler = lazy_import(".start_message_handler", __package__)
 
 
 @controller
 @dataclass
 class StartMessageController:
-    handler: StartMessageHandler
+    handler: "start_message_handler.StartMessageHandler"
 
     @on_message(filters.su_cmd("start"))
     async def start(self, client: Client, message: Message):
@@ -1,4 +1,3 @@
 from .upgrade_message_controller import UpgradeMessageController
-from .upgrade_message_handler import UpgradeMessageHandler
 
-__all__ = ["UpgradeMessageController", "UpgradeMessageHandler"]
+__all__ = ["UpgradeMessageController"]
@@ -4,15 +4,15 @@ from hydrogram import Client, filters
 from hydrogram.types import Message
 
 from userlixo.decorators import controller, on_message
-from userlixo.modules.userbot.upgrade.message.upgrade_message_handler import (
-    UpgradeMessageHandler,
-)
+from userlixo.utils.lazy import lazy_import
+
+upgrade_message_handler = lazy_import(".upgrade_message_handler", __package__)
 
 
 @controller
 @dataclass
 class UpgradeMessageController:
-    handler: UpgradeMessageHandler
+    handler: "upgrade_message_handler.UpgradeMessageHandler"
 
     @on_message(filters.su_cmd("upgrade"))
     async def upgrade(self, client: Client, message: Message):
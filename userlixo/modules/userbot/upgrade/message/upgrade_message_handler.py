@@ -27,7 +27,7 @@ class UpgradeMessageHandler(MessageHandler):
             chat_id = msg.chat.id
             message_id = msg.id
 
-            save_before_restart_message_info(message_id, chat_id, "user")
+            await save_before_restart_message_info(message_id, chat_id, "user")
 
         await (
             UpgradeLogicBuilder.set_lang(lang)
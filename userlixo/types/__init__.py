@@ -1,3 +1,4 @@
+from .callback_query_router import CallbackQueryRouter
 from .update_controller import UpdateController
 
-__all__ = ["UpdateController"]
+__all__ = ["CallbackQueryRouter", "UpdateController"]
@@ -0,0 +1,154 @@
+import logging
+import re
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
+
+import hydrogram
+from hydrogram.filters import Filter
+from hydrogram.handlers import CallbackQueryHandler
+from hydrogram.types import CallbackQuery
+
+from userlixo.utils.services.command_router import TrieNode, has_top_level_alternation
+
+logger = logging.getLogger(__name__)
+
+# ^token followed by what comes after it in the pattern, and whether that is quantified
+ANCHORED_LITERAL = re.compile(r"\^(?P<token>\w+)(?P<next>\\s|.)?(?P<quantifier>[?*{])?", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class CallbackRouteKey:
+    token: str
+    # exact: the first token of callback_data must equal `token`, otherwise start with it
+    exact: bool
+
+
+def extract_callback_route_key(filters: Filter | None) -> CallbackRouteKey | None:
+    pattern = getattr(filters, "p", None)
+    if not isinstance(pattern, re.Pattern) or not isinstance(pattern.pattern, str):
+        return None
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE | re.MULTILINE):
+        return None
+    if has_top_level_alternation(pattern.pattern):
+        return None
+
+    match = ANCHORED_LITERAL.match(pattern.pattern)
+    if not match:
+        return None
+
+    token, following = match["token"], match["next"]
+    if following in {None, "$", " ", r"\s"}:
+        # An optional separator (^foo\s*, ^foo ?) also matches foobar, leaving just a prefix
+        exact = following is not None and not match["quantifier"]
+        return CallbackRouteKey(token, exact=exact)
+    if following in {"?", "*", "{"}:
+        token = token[:-1]
+    return CallbackRouteKey(token, exact=False) if token else None
+
+
+@dataclass(frozen=True)
+class CallbackRoute:
+    order: int
+    handler: CallbackQueryHandler
+    key: CallbackRouteKey | None
+
+
+class CallbackQueryRouter(CallbackQueryHandler):
+    def __init__(self):
+        super().__init__(self.dispatch)
+        self.order = 0
+        self.routes: tuple[CallbackRoute, ...] = ()
+        self.rebuild()
+
+    @classmethod
+    def get_or_create(cls, client: hydrogram.Client, group: int):
+        routers = client.__dict__.setdefault("callback_query_routers", {})
+        if group not in routers:
+            routers[group] = cls()
+            client.add_handler(routers[group], group)
+        return routers[group]
+
+    # Tables are rebuilt and swapped as a whole so in-flight dispatches keep a consistent view
+    def rebuild(self):
+        exact: dict[str, list[CallbackRoute]] = {}
+        prefixed = TrieNode()
+        unkeyed = []
+
+        for route in self.routes:
+            if route.key is None:
+                unkeyed.append(route)
+            elif route.key.exact:
+                exact.setdefault(route.key.token, []).append(route)
+            else:
+                prefixed.insert(route.key.token, route)
+
+        self.tables = (exact, prefixed, tuple(unkeyed))
+
+    def add_route(self, handler: CallbackQueryHandler, key: CallbackRouteKey | None):
+        route = CallbackRoute(self.order, handler, key)
+        self.order += 1
+        self.routes = (*self.routes, route)
+        self.rebuild()
+        return route
+
+    def remove_route(self, handler: CallbackQueryHandler):
+        self.routes = tuple(r for r in self.routes if r.handler is not handler)
+        self.rebuild()
+
+    def remove_plugin_routes(self, plugin_name: str):
+        self.routes = tuple(
+            r for r in self.routes if getattr(r.handler, "plugin_handler", None) != plugin_name
+        )
+        self.rebuild()
+
+    def get_candidates(self, data: str | bytes | None) -> list[CallbackRoute]:
+        exact, prefixed, unkeyed = self.tables
+        if not isinstance(data, str):
+            return [*unkeyed]
+
+        token = data.split(maxsplit=1)[0] if data.strip() else ""
+        candidates = [*exact.get(token, ()), *prefixed.collect(token, 0), *unkeyed]
+        return sorted(candidates, key=lambda r: r.order)
+
+    async def check(self, client: hydrogram.Client, query: CallbackQuery) -> bool:
+        # Filters run in dispatch, one route after the other, like hydrogram runs a group
+        query._routes = self.get_candidates(query.data)
+        if query._routes:
+            return True
+
+        # No route wants it, but a pending listener (e.g. from query.ask) still has to be resolved
+        listener_does_match, _listener = await self.check_if_has_matching_listener(client, query)
+        return listener_does_match
+
+    @staticmethod
+    async def run_route(client: hydrogram.Client, route: CallbackRoute, query, *args) -> bool:
+        if not await route.handler.check(client, query):
+            return False
+
+        callback = route.handler.original_callback
+        if iscoroutinefunction(callback):
+            await callback(client, query, *args)
+        else:
+            await client.loop.run_in_executor(client.executor, callback, client, query, *args)
+        return True
+
+    @classmethod
+    async def dispatch(cls, client: hydrogram.Client, query: CallbackQuery, *args):
+        # Every matching route runs, in registration order, with the dispatcher's error handling
+        for route in getattr(query, "_routes", ()):
+            try:
+                await cls.run_route(client, route, query, *args)
+            except hydrogram.StopPropagation:
+                raise
+            except hydrogram.ContinuePropagation:
+                continue
+            except Exception as e:
+                await cls.handle_error(client, e)
+
+    @staticmethod
+    async def handle_error(client: hydrogram.Client, error: Exception):
+        for error_handler in client.dispatcher.error_handlers:
+            if await error_handler.check(client, error):
+                await error_handler.callback(client, error)
+                return
+        logger.exception(error)
@@ -1,6 +1,26 @@
 import hydrogram
+from hydrogram.errors import FloodWait
+from kink import di
+
+from userlixo.utils.services.metrics import Metrics
 
 
 class Client(hydrogram.client.Client):
     me: hydrogram.types.User
     assistant: hydrogram.client.Client
+
+    @property
+    def kind(self) -> str:
+        return "bot" if self.bot_token else "user"
+
+    async def invoke(self, query, *args, **kwargs):
+        metrics = di[Metrics]
+        if not metrics.enabled:
+            return await super().invoke(query, *args, **kwargs)
+
+        metrics.record_api_call(self.kind, type(query).__name__)
+        try:
+            return await super().invoke(query, *args, **kwargs)
+        except FloodWait as e:
+            metrics.record_flood_wait(self.kind, e.value)
+            raise
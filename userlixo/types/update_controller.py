@@ -1,23 +1,38 @@
 import inspect
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, get_type_hints
 
 from hydrogram import Client
 from hydrogram.handlers import CallbackQueryHandler, InlineQueryHandler, MessageHandler
 from kink import di
 
+from userlixo.types.callback_query_router import CallbackQueryRouter
+from userlixo.utils.services.handler_metrics import PROPAGATION_EXCEPTIONS, HandlerMetrics
+from userlixo.utils.services.loop_monitor import LoopLagMonitor
+
 
 class UpdateController:
     def __init__(self, cls, plugin_handler: str | None = None):
         self.registers = []
         self.unregisters = []
         self.cls = cls
-        self.cls_instance = self.get_cls_instance()
+        # Built on first dispatch, so the handlers it depends on aren't resolved at import time
+        self.cls_instance = None
         self.plugin_handler = plugin_handler
 
         self.import_handlers()
 
     def get_cls_instance(self):
-        return di[self.cls] if self.cls in di else self.cls()
+        if self.cls_instance is None:
+            self.cls_instance = self.cls(**self.resolve_dependencies())
+        return self.cls_instance
+
+    def resolve_dependencies(self) -> dict[str, Any]:
+        # Controllers annotate their handlers as "module.Handler" strings over lazy_import()ed
+        # modules, so only registering the routes doesn't import the handlers. They are evaluated
+        # here, on the first dispatch; whatever isn't resolved is left to kink as before
+        hints = get_type_hints(self.cls)
+        return {name: di[hint] for name, hint in hints.items() if hint in di}
 
     def get_method(self, key):
         return self.cls.__dict__[key] if key in self.cls.__dict__ else getattr(self.cls, key)
@@ -26,7 +41,7 @@ class UpdateController:
         method = self.get_method(key)
         return isinstance(method, staticmethod)
 
-    def get_method_callable(self, key):
+    def get_method_callable(self, key, plugin_handler: str | None = None):
         is_static = self.is_method_static(key)
         method = self.get_method(key)
         if is_static:
@@ -34,18 +49,50 @@ class UpdateController:
 
         is_async = inspect.iscoroutinefunction(method)
 
+        metrics = di[HandlerMetrics]
+        stats = metrics.track(f"{self.cls.__name__}.{key}", plugin_handler or self.plugin_handler)
+
         def call(*args, **kwargs):
-            return method(self.cls_instance, *args, **kwargs)
+            if not metrics.enabled:
+                return method(self.get_cls_instance(), *args, **kwargs)
+
+            failed = False
+            start = perf_counter_ns()
+            try:
+                return method(self.get_cls_instance(), *args, **kwargs)
+            except PROPAGATION_EXCEPTIONS:
+                raise
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                stats.record(perf_counter_ns() - start, failed)
 
         async def async_call(*args, **kwargs):
-            return await method(self.cls_instance, *args, **kwargs)
+            if not metrics.enabled:
+                return await method(self.get_cls_instance(), *args, **kwargs)
+
+            failed = False
+            start = perf_counter_ns()
+            try:
+                return await method(self.get_cls_instance(), *args, **kwargs)
+            except PROPAGATION_EXCEPTIONS:
+                raise
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                stats.record(perf_counter_ns() - start, failed)
 
         return async_call if is_async else call
 
     def register_handler(
         self, client: Client, plugin_handler: str | None = None, key=None, method=None
     ):
-        method_callable = self.get_method_callable(key)
+        method_callable = self.get_method_callable(key, plugin_handler)
+        if plugin := plugin_handler or self.plugin_handler:
+            # Lets the loop watchdog blame this plugin for stalls inside the handler
+            di[LoopLagMonitor].tag_code(getattr(method, "__func__", method).__code__, plugin)
         filters = method.filters if hasattr(method, "filters") else None
         group = method.group if hasattr(method, "group") else 0
 
@@ -53,7 +100,13 @@ class UpdateController:
         if method.on == "message":
             handler = client.add_handler(MessageHandler(method_callable, filters), group)
         elif method.on == "callback_query":
-            handler = client.add_handler(CallbackQueryHandler(method_callable, filters), group)
+            router = CallbackQueryRouter.get_or_create(client, group)
+            route_key = getattr(method, "callback_route_key", None)
+            route = router.add_route(CallbackQueryHandler(method_callable, filters), route_key)
+            if plugin_handler is not None:
+                route.handler.plugin_handler = plugin_handler
+
+            self.unregisters.append(lambda: router.remove_route(route.handler))
         elif method.on == "inline_query":
             handler = client.add_handler(InlineQueryHandler(method_callable, filters), group)
 
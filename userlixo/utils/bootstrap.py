@@ -0,0 +1,80 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Phase:
+    name: str
+    # Either a coroutine function or a plain one
+    run: Callable
+    after: tuple[str, ...] = field(default=())
+
+
+def check_phases(phases: list[Phase]):
+    names = {phase.name for phase in phases}
+    if len(names) != len(phases):
+        msg = "Duplicate phase names"
+        raise ValueError(msg)
+
+    for phase in phases:
+        if missing := set(phase.after) - names:
+            msg = f"Phase {phase.name} depends on unknown phases: {', '.join(sorted(missing))}"
+            raise ValueError(msg)
+
+    # Depth-first walk to refuse cycles before anything runs
+    done: set[str] = set()
+    visiting: set[str] = set()
+    by_name = {phase.name: phase for phase in phases}
+
+    def visit(name: str):
+        if name in done:
+            return
+        if name in visiting:
+            msg = f"Phase {name} depends on itself"
+            raise ValueError(msg)
+        visiting.add(name)
+        for dependency in by_name[name].after:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for phase in phases:
+        visit(phase.name)
+
+
+async def run_phases(phases: list[Phase]) -> dict[str, float]:
+    # Runs each phase as soon as the ones it comes after are done, so independent phases run
+    # concurrently. Returns the wall time of each phase in seconds, in the order they finished.
+    check_phases(phases)
+
+    timings: dict[str, float] = {}
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run_phase(phase: Phase):
+        dependencies = [tasks[name] for name in phase.after]
+        if dependencies:
+            await asyncio.wait(dependencies)
+        # The failed dependency is what gets reported, this phase is just skipped
+        if any(task.cancelled() or task.exception() for task in dependencies):
+            return
+
+        logger.debug("Running %s...", phase.name)
+        started = time.perf_counter()
+        result = phase.run()
+        if inspect.isawaitable(result):
+            await result
+        timings[phase.name] = time.perf_counter() - started
+        logger.debug("Ran %s in %.3fs", phase.name, timings[phase.name])
+
+    # A failing phase cancels the ones still running and is raised from here
+    async with asyncio.TaskGroup() as group:
+        for phase in phases:
+            tasks[phase.name] = group.create_task(run_phase(phase))
+
+    return timings
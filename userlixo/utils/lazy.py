@@ -0,0 +1,24 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str, package: str | None = None) -> ModuleType:
+    # The module is only executed on first attribute access, keeping heavy libraries that are
+    # needed for a few commands (plugin installs, evals) off the startup path. Relative names
+    # are resolved against `package`, like importlib.import_module() does
+    name = importlib.util.resolve_name(name, package)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        msg = f"No module named {name!r}"
+        raise ModuleNotFoundError(msg, name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -2,13 +2,14 @@
 # Copyright (c) 2018-2022 Amano Team
 
 import contextlib
-import json
 from enum import Enum
 
 from hydrogram import types
+from hydrogram.errors import QueryIdInvalid, ResultIdInvalid
 from hydrogram.helpers import bki, ikb
+from kink import di
 
-from userlixo.database import Message
+from userlixo.utils.services.keyboard_stash import KeyboardStash
 
 
 async def query_edit(self, text: str, reply_markup=None, answer_kwargs=None, *args, **kwargs):
@@ -87,15 +88,23 @@ async def reply_text(self, text: str, reply_markup=None, *args, **kwargs):
     if type(reply_markup) == types.InlineKeyboardMarkup:
         reply_markup = bki(reply_markup)
 
-    reply_markup_json = json.dumps(reply_markup)
-    message = Message(keyboard=reply_markup_json, text=text)
-    message.save()
+    stash = di[KeyboardStash]
+    token = await stash.put(text, reply_markup)
+
+    # Identical replies sent recently reuse the inline result instead of asking the bot again
+    cached = stash.get_result(token)
+    if cached:
+        try:
+            return await self._client.send_inline_bot_result(
+                self.chat.id, cached.query_id, cached.result_id, reply_to_message_id=reply_to
+            )
+        except (QueryIdInvalid, ResultIdInvalid):
+            stash.forget_result(token)
 
     bot = self._client.assistant
-    inline_results = await self._client.get_inline_bot_results(
-        bot.me.username or bot.me.id, str(message.key)
-    )
+    inline_results = await self._client.get_inline_bot_results(bot.me.username or bot.me.id, token)
     result = inline_results.results[0]
+    stash.set_result(token, inline_results.query_id, result.id, inline_results.cache_time)
 
     return await self._client.send_inline_bot_result(
         self.chat.id,
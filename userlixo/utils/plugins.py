@@ -1,38 +1,80 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2018-2022 Amano Team
 import asyncio
+import contextlib
+import hashlib
 import importlib
 import json
 import logging
+import os
 import re
+import sys
+import tempfile
+import time
 import typing
 from collections.abc import Callable
+from dataclasses import dataclass
 from inspect import iscoroutinefunction
 from pathlib import Path
 from shutil import rmtree
+from types import ModuleType
 from zipfile import ZipFile
 
-import requirements
-import toml
-import virtualenv
-from activate_virtualenv import activate_virtualenv
-
-from userlixo.config import bot, plugins, user
-from userlixo.database import Config, PluginSetting
+from userlixo.config import bot, config_store, plugin_index, plugins, startup_profiler, user
+from userlixo.database import repositories
+from userlixo.types.callback_query_router import CallbackQueryRouter
 from userlixo.types.client import Client
 from userlixo.types.handler_callable import HandlerCallable
 from userlixo.types.plugin_element_collection import PluginElementCollection
 from userlixo.types.plugin_info import PluginInfo
 from userlixo.types.plugin_settings import PluginSettings
-from userlixo.utils import shell_exec
+from userlixo.utils import requirements_resolver, wheelhouse
+from userlixo.utils.lazy import lazy_import
 from userlixo.utils.validation import ValidateSetting
 
+activate_virtualenv = lazy_import("activate_virtualenv")
+requirements = lazy_import("requirements")
+toml = lazy_import("toml")
+virtualenv = lazy_import("virtualenv")
+
 logger = logging.getLogger(__name__)
 
+REQUIREMENTS_FINGERPRINT_FILE = ".userlixo-requirements"
+# How many plugins may have their venv/requirements prepared at the same time
+PLUGIN_LOAD_CONCURRENCY = int(os.getenv("PLUGIN_LOAD_CONCURRENCY") or 4)
+# With PLUGIN_SHARED_ENV=true, plugins whose requirements don't conflict share this venv, so
+# common libraries are installed and imported once
+SHARED_VENV_PATH = Path("plugins-venv")
+SHARED_REQUIREMENTS_PATH = Path("plugins-requirements.txt")
+# Plugins being installed are extracted here, on the same filesystem as the plugins folder so
+# they can be renamed into it
+STAGING_PATH = Path("userlixo/.plugins-staging")
+BACKUP_SUFFIX = ".old"
+
+# Requirement lines of each plugin using the shared venv
+shared_env_requirements: dict[str, list[str]] = {}
+shared_env_lock = asyncio.Lock()
+# Modules of the versions being replaced by an install, kept until it succeeds or is rolled back
+replaced_plugin_modules: dict[str, dict[str, ModuleType]] = {}
+
+
+@dataclass(frozen=True)
+class PluginLoadResult:
+    name: str
+    seconds: float | None = None
+    error: Exception | None = None
+
+
+def is_shared_env_enabled() -> bool:
+    return os.getenv("PLUGIN_SHARED_ENV") == "true"
 
-def get_inactive_plugins(plugins):
-    inactive = (Config.get_or_create(defaults={"value": "[]"}, key="INACTIVE_PLUGINS"))[0].value
-    return json.loads(inactive)
+
+def parse_plugin_names(value: str) -> frozenset[str]:
+    return frozenset(json.loads(value))
+
+
+def get_inactive_plugins(plugins) -> frozenset[str]:
+    return config_store.get_parsed("INACTIVE_PLUGINS", parse_plugin_names, frozenset())
 
 
 class InvalidPluginInfoValueError(ValueError):
@@ -52,10 +94,91 @@ def check_if_plugin_folder_exists(plugin_name: str):
     return plugin_folder.exists()
 
 
-def unzip_plugin_to_folder(zip_path: str, plugin_name: str):
+def extract_plugin_to_staging(zip_path: str, plugin_name: str) -> Path:
+    STAGING_PATH.mkdir(parents=True, exist_ok=True)
+    staged = Path(tempfile.mkdtemp(prefix=f"{plugin_name}-", dir=STAGING_PATH))
+    try:
+        with ZipFile(zip_path, "r") as zipfile:
+            zipfile.extractall(staged)
+        validate_plugin_folder_path(staged)
+    except BaseException:
+        rmtree(staged, ignore_errors=True)
+        raise
+    return staged
+
+
+async def stage_plugin(zip_path: str, plugin_name: str) -> Path:
+    # Extracting big zips would block the loop
+    return await asyncio.to_thread(extract_plugin_to_staging, zip_path, plugin_name)
+
+
+def swap_in_plugin(staged: Path, plugin_name: str) -> Path | None:
+    # Renames are atomic, so the plugin folder is always either complete or missing. Returns
+    # where the plugin that was already there (if any) was moved to
     folder_path = get_plugin_folder_path(plugin_name)
-    with ZipFile(zip_path, "r") as zipfile:
-        zipfile.extractall(str(folder_path))
+    folder_path.parent.mkdir(parents=True, exist_ok=True)
+
+    backup = None
+    try:
+        if folder_path.exists():
+            backup = staged.with_name(staged.name + BACKUP_SUFFIX)
+            folder_path.rename(backup)
+        staged.rename(folder_path)
+    except OSError:
+        if backup is not None and not folder_path.exists():
+            backup.rename(folder_path)
+        rmtree(staged, ignore_errors=True)
+        raise
+    return backup
+
+
+async def rollback_plugin(plugin_name: str, backup: Path | None):
+    # hydrogram adds handlers in tasks; the new version's ones must be added before removing them
+    await asyncio.sleep(0)
+    remove_plugin_handlers(plugin_name, user)
+    remove_plugin_handlers(plugin_name, bot)
+    shared_env_requirements.pop(plugin_name, None)
+
+    folder_path = get_plugin_folder_path(plugin_name)
+    await asyncio.to_thread(rmtree, folder_path, ignore_errors=True)
+    modules = replaced_plugin_modules.pop(plugin_name, None)
+    if backup is None:
+        unimport_plugin(plugin_name)
+        return
+
+    backup.rename(folder_path)
+    if modules is not None:
+        # Whatever the new version imported goes away, the previous modules come back as they were
+        unimport_plugin(plugin_name)
+        restore_plugin_modules(modules)
+    # The version that was replaced was running, so it goes back to running
+    if plugin_name not in plugins or plugin_name in get_inactive_plugins(plugins):
+        return
+    try:
+        if is_shared_env_enabled():
+            info = get_plugin_info_from_folder(plugin_name)
+            await join_shared_env(plugin_name, get_plugin_requirement_lines(info))
+        await activate_plugin(plugin_name)
+    except Exception as e:
+        logger.exception("Error while reactivating the previous %s", plugin_name, exc_info=e)
+
+
+async def discard_plugin_backup(plugin_name: str, backup: Path | None):
+    replaced_plugin_modules.pop(plugin_name, None)
+    if backup is not None:
+        await asyncio.to_thread(rmtree, backup, ignore_errors=True)
+
+
+def clean_plugin_staging():
+    # Left behind by installs that were interrupted; a plugin whose folder had been moved out
+    # but not replaced yet gets it back
+    for backup in STAGING_PATH.glob(f"*{BACKUP_SUFFIX}"):
+        plugin_name = backup.name.rpartition("-")[0]
+        folder_path = get_plugin_folder_path(plugin_name)
+        if not folder_path.exists():
+            backup.rename(folder_path)
+
+    rmtree(STAGING_PATH, ignore_errors=True)
 
 
 def get_plugin_info_from_zip(zip_path: str) -> PluginInfo | None:
@@ -76,27 +199,35 @@ def get_plugin_info_from_zip(zip_path: str) -> PluginInfo | None:
 
 def get_plugin_info_from_folder(plugin_name: str) -> PluginInfo | None:
     folder_path = get_plugin_folder_path(plugin_name)
-    if not (folder_path / "plugin.toml").exists():
+    manifest_path = folder_path / "plugin.toml"
+    if not manifest_path.exists():
         return None
 
-    info_toml = (folder_path / "plugin.toml").read_text()
-    info = parse_plugin_info_from_toml(info_toml)
+    # Already validated, parsed and validated again only if plugin.toml changed
+    manifest = plugin_index.get_manifest(plugin_name, manifest_path, parse_and_validate_manifest)
+    info = build_plugin_info(manifest)
 
     if info:
         info.folder_path = str(folder_path)
 
-    validate_plugin_info(info)
-
     return info
 
 
+def parse_and_validate_manifest(content: bytes) -> dict:
+    parsed_toml = toml.loads(content.decode("utf-8"))
+    validate_plugin_info(build_plugin_info(parsed_toml))
+    return parsed_toml
+
+
 def parse_plugin_info_from_toml(content: str) -> PluginInfo | None:
-    parsed_toml = toml.loads(content)
+    return build_plugin_info(toml.loads(content))
 
+
+def build_plugin_info(parsed_toml: dict) -> PluginInfo | None:
     if "plugin" not in parsed_toml:
         return None
 
-    settings = parsed_toml.get("settings", None)
+    settings = parsed_toml.get("settings")
 
     return PluginInfo().fill_info(parsed_toml["plugin"]).fill_settings(settings)
 
@@ -184,6 +315,38 @@ def convert_parsed_requirements_to_pip_format(parsed_requirements: dict):
     return "\n".join([parsed.line for parsed in parsed_requirements.values()])
 
 
+def get_plugin_requirement_lines(info: PluginInfo) -> list[str]:
+    return [parsed.line for parsed in parse_plugin_requirements_from_info(info).values()]
+
+
+def find_plugin_conflicts(info: PluginInfo) -> list[requirements_resolver.RequirementConflict]:
+    # Checks a plugin about to be installed against every installed one but an older copy of
+    # itself. Even in separate venvs only one version of a library can be imported at a time
+    requirements_by_plugin = {}
+    for other in plugins.values():
+        if other.name != info.name:
+            with contextlib.suppress(InvalidPluginInfoValueError):
+                requirements_by_plugin[other.name] = get_plugin_requirement_lines(other)
+    requirements_by_plugin[info.name] = get_plugin_requirement_lines(info)
+
+    conflicts = requirements_resolver.find_conflicts(requirements_by_plugin)
+    return [conflict for conflict in conflicts if info.name in conflict.plugins]
+
+
+def select_shared_env_plugins(
+    requirements_by_plugin: dict[str, list[str]],
+) -> dict[str, list[str]]:
+    # In name order, each plugin joins unless it conflicts with one that already did
+    shared = {}
+    for plugin_name, lines in sorted(requirements_by_plugin.items()):
+        candidate = {**shared, plugin_name: lines}
+        if requirements_resolver.find_conflicts(candidate):
+            logger.info("Requirements of %s conflict with the shared venv", plugin_name)
+            continue
+        shared = candidate
+    return shared
+
+
 def write_plugin_requirements_txt(plugin_name: str) -> str:
     folder_path = get_plugin_folder_path(plugin_name)
 
@@ -201,22 +364,109 @@ def write_plugin_requirements_txt(plugin_name: str) -> str:
     return str(requirements_txt_path)
 
 
-async def install_plugin_requirements_in_its_venv(plugin_name: str):
-    venv_path = await get_plugin_venv_path(plugin_name)
-    requirements_txt_path = write_plugin_requirements_txt(plugin_name)
+def get_requirements_fingerprint(requirements_txt_path: str) -> str:
+    # Changes whenever the requirements or the interpreter the venv was built for change
+    digest = hashlib.sha256()
+    content = Path(requirements_txt_path).read_text(encoding="utf-8")
+    for part in (sys.version, sys.executable, content):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
-    stdout, process = await shell_exec(f"{venv_path}/bin/pip install -r {requirements_txt_path}")
 
-    if process.returncode != 0:
-        msg = f"Error while installing requirements: {stdout}"
-        raise ValueError(msg)
+async def install_requirements_in_venv(
+    venv_path: str, requirements_txt_path: str, force: bool = False
+):
+    # Stored inside the venv, so a recreated venv is always installed again
+    fingerprint = get_requirements_fingerprint(requirements_txt_path)
+    fingerprint_path = Path(venv_path) / REQUIREMENTS_FINGERPRINT_FILE
+    installed = fingerprint_path.read_text(encoding="utf-8") if fingerprint_path.exists() else None
+    force = force or "--reinstall-plugin-deps" in sys.argv
+    if not force and installed == fingerprint:
+        logger.debug("Requirements of %s are up to date, skipping pip", venv_path)
+        return None
+
+    stdout = await wheelhouse.install_requirements(venv_path, requirements_txt_path)
+    saved = await asyncio.to_thread(wheelhouse.deduplicate_venv, venv_path)
+    logger.debug("Linked %d bytes of %s to files other venvs already have", saved, venv_path)
 
+    fingerprint_path.write_text(fingerprint, encoding="utf-8")
     return stdout
 
 
+async def install_plugin_requirements_in_its_venv(plugin_name: str, force: bool = False):
+    if plugin_name in shared_env_requirements:
+        return None
+
+    # Creating a venv takes a while and would block the loop
+    venv_path = await asyncio.to_thread(get_plugin_venv_path, plugin_name)
+    requirements_txt_path = write_plugin_requirements_txt(plugin_name)
+    return await install_requirements_in_venv(venv_path, requirements_txt_path, force)
+
+
+async def install_shared_env_requirements(requirements_by_plugin: dict[str, list[str]]):
+    if not SHARED_VENV_PATH.exists():
+        await asyncio.to_thread(create_virtualenv, str(SHARED_VENV_PATH))
+
+    # In name order, so the fingerprint only changes when the requirements do
+    lines = [
+        line for _, plugin_lines in sorted(requirements_by_plugin.items()) for line in plugin_lines
+    ]
+    SHARED_REQUIREMENTS_PATH.write_text("\n".join(dict.fromkeys(lines)), encoding="utf-8")
+    return await install_requirements_in_venv(str(SHARED_VENV_PATH), str(SHARED_REQUIREMENTS_PATH))
+
+
+async def prepare_shared_env(plugin_names: list[str]):
+    # Installs every compatible plugin in the shared venv at once on startup
+    requirements_by_plugin = {}
+    for plugin_name in plugin_names:
+        try:
+            info = get_plugin_info_from_folder(plugin_name)
+            if info:
+                requirements_by_plugin[plugin_name] = get_plugin_requirement_lines(info)
+        except Exception as e:
+            # Reported when the plugin itself is loaded
+            logger.debug("Leaving %s out of the shared venv: %s", plugin_name, e)
+
+    shared = select_shared_env_plugins(requirements_by_plugin)
+    try:
+        await install_shared_env_requirements(shared)
+    except Exception as e:
+        # Plugins then join one by one, so a single broken requirement only keeps its own out
+        logger.exception("Error while preparing the shared plugin venv", exc_info=e)
+        return
+
+    shared_env_requirements.clear()
+    shared_env_requirements.update(shared)
+
+
+async def join_shared_env(plugin_name: str, lines: list[str]) -> bool:
+    # Adds a plugin to the shared venv if its requirements fit the ones already there
+    async with shared_env_lock:
+        if shared_env_requirements.get(plugin_name) == lines:
+            return True
+
+        shared_env_requirements.pop(plugin_name, None)
+        candidate = {**shared_env_requirements, plugin_name: lines}
+        if requirements_resolver.find_conflicts(candidate):
+            return False
+
+        try:
+            await install_shared_env_requirements(candidate)
+        except Exception as e:
+            logger.warning("Could not install %s in the shared venv: %s", plugin_name, e)
+            return False
+
+        shared_env_requirements[plugin_name] = lines
+        return True
+
+
 def get_plugin_venv_path(
     plugin_name: str, create_if_not_exists: bool = True, overwrite_if_exists: bool = False
 ):
+    if plugin_name in shared_env_requirements:
+        return str(SHARED_VENV_PATH)
+
     folder_path = get_plugin_folder_path(plugin_name)
     venv_path = str(folder_path / "venv")
 
@@ -233,45 +483,80 @@ def create_virtualenv(venv_path: str):
     virtualenv.cli_run([venv_path])
 
 
-def load_settings_values_for_plugin(plugin_name: str):
+async def load_settings_values_for_plugin(plugin_name: str):
     plugin_info = plugins.get(plugin_name, None)
     if not plugin_info:
         return
-    settings = PluginSetting.select(PluginSetting.plugin == plugin_name)
+    settings = await repositories.get_plugin_settings(plugin_name)
 
-    for setting in settings:
-        if setting.key not in plugin_info.settings:
+    for key, value in settings.items():
+        if key not in plugin_info.settings:
             continue
 
-        plugin_info.settings[setting.key].value = setting.value
+        plugin_info.settings[key].value = value
 
 
-def load_all_installed_plugins():
-    inactive = get_inactive_plugins(plugins)
+async def load_inactive_plugin(plugin_name: str):
+    info = get_plugin_info_from_folder(plugin_name)
 
-    for folder in Path().glob("userlixo/plugins/*"):
-        if not folder.is_dir():
-            continue
+    if info:
+        plugins[info.name] = info
+        await load_settings_values_for_plugin(info.name)
 
-        plugin_name = folder.stem
-        if plugin_name in inactive:
-            try:
-                info = get_plugin_info_from_folder(plugin_name)
-                validate_plugin_info(info)
 
-                if info:
-                    plugins[info.name] = info
-                    load_settings_values_for_plugin(info.name)
+async def load_all_installed_plugins() -> list[PluginLoadResult]:
+    # Plugins are prepared (manifest, venv, pip) concurrently, but imported and registered one
+    # at a time in name order: activating a venv patches sys.path and handler order must not
+    # depend on which install finished first
+    inactive = get_inactive_plugins(plugins)
+    await asyncio.to_thread(clean_plugin_staging)
+    names = sorted(folder.stem for folder in Path().glob("userlixo/plugins/*") if folder.is_dir())
+    plugin_index.prune(names)
 
+    for plugin_name in names:
+        if plugin_name in inactive:
+            try:
+                await load_inactive_plugin(plugin_name)
             except Exception as e:
                 logger.exception("Error while loading inactive plugin", exc_info=e)
-            continue
 
+    semaphore = asyncio.Semaphore(PLUGIN_LOAD_CONCURRENCY)
+
+    async def prepare(plugin_name: str) -> tuple[PluginInfo, float]:
+        async with semaphore:
+            started = time.perf_counter()
+            info = await prepare_plugin(plugin_name)
+            return info, time.perf_counter() - started
+
+    active = [name for name in names if name not in inactive]
+    if is_shared_env_enabled():
+        await prepare_shared_env(active)
+
+    preparations = [asyncio.create_task(prepare(name)) for name in active]
+
+    results = []
+    for plugin_name, preparation in zip(active, preparations, strict=True):
         try:
-            info = load_plugin(plugin_name)
+            info, seconds = await preparation
+            started = time.perf_counter()
+            await activate_plugin(plugin_name)
             plugins[info.name] = info
+            seconds += time.perf_counter() - started
         except Exception as e:
-            logger.exception("Error while loading plugin", exc_info=e)
+            logger.exception("Error while loading plugin %s", plugin_name, exc_info=e)
+            results.append(PluginLoadResult(plugin_name, error=e))
+            continue
+
+        startup_profiler.record(f"plugin {plugin_name}", seconds)
+        logger.info("Loaded plugin %s in %.2fs", plugin_name, seconds)
+        results.append(PluginLoadResult(plugin_name, seconds=seconds))
+
+    venv_paths = {get_plugin_venv_path(name, create_if_not_exists=False) for name in names}
+    removed = await asyncio.to_thread(wheelhouse.collect_garbage, venv_paths)
+    if removed:
+        logger.info("Removed %d unused wheel(s) and stored file(s)", len(removed))
+
+    return results
 
 
 def filepath_to_notation(filepath: str):
@@ -284,6 +569,30 @@ def import_module_from_filepath(filepath: str):
     return importlib.import_module(notation)
 
 
+def unimport_plugin(plugin_name: str) -> dict[str, ModuleType]:
+    # import_module() returns what is in sys.modules, so the plugin's code is only read from
+    # disk again once its package and submodules are dropped. Returns the dropped modules
+    notation = filepath_to_notation(str(get_plugin_folder_path(plugin_name)))
+    modules = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == notation or name.startswith(f"{notation}.")
+    }
+    for name in modules:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+    return modules
+
+
+def restore_plugin_modules(modules: dict[str, ModuleType]):
+    sys.modules.update(modules)
+    # The parent packages point to their submodules too
+    for name, module in modules.items():
+        parent, _, child = name.rpartition(".")
+        if parent in sys.modules:
+            setattr(sys.modules[parent], child, module)
+
+
 def fetch_plugin_elements(plugin_name: str) -> PluginElementCollection | None:
     folder_path = get_plugin_folder_path(plugin_name)
     try:
@@ -329,8 +638,10 @@ def fetch_plugin_elements(plugin_name: str) -> PluginElementCollection | None:
 
 
 def validate_plugin_folder(plugin_name: str):
-    folder_path = get_plugin_folder_path(plugin_name)
+    validate_plugin_folder_path(get_plugin_folder_path(plugin_name))
+
 
+def validate_plugin_folder_path(folder_path: Path):
     if not folder_path.is_dir():
         msg = f"Invalid folder path: {folder_path} is not a folder"
         raise ValueError(msg)
@@ -344,19 +655,41 @@ def validate_plugin_folder(plugin_name: str):
         raise ValueError(msg)
 
 
-async def load_plugin(plugin_name: str):
+async def prepare_plugin(plugin_name: str) -> PluginInfo:
+    # Everything that can run alongside other plugins: no imports, no handlers
     validate_plugin_folder(plugin_name)
 
+    # Validated by the index whenever plugin.toml changed
     info = get_plugin_info_from_folder(plugin_name)
-    validate_plugin_info(info)
 
-    venv_path = get_plugin_venv_path(plugin_name)
+    if is_shared_env_enabled():
+        await join_shared_env(plugin_name, get_plugin_requirement_lines(info))
     await install_plugin_requirements_in_its_venv(plugin_name)
+    return info
 
-    with activate_virtualenv(venv_path):
+
+async def activate_plugin(plugin_name: str, replace: bool = False):
+    # Imports the plugin and registers its handlers and controllers, replacing the ones of the
+    # version that was running before if asked to
+    if replace:
+        remove_plugin_handlers(plugin_name, user)
+        remove_plugin_handlers(plugin_name, bot)
+        replaced_plugin_modules.setdefault(plugin_name, unimport_plugin(plugin_name))
+
+    venv_path = get_plugin_venv_path(plugin_name, create_if_not_exists=False)
+
+    with activate_virtualenv.activate_virtualenv(venv_path):
         elements = fetch_plugin_elements(plugin_name)
+    if elements is None:
+        msg = f"Could not import plugin {plugin_name}, see the logs for the error"
+        raise ImportError(msg)
+
     await load_plugin_elements(elements, plugin_name)
 
+
+async def load_plugin(plugin_name: str) -> PluginInfo:
+    info = await prepare_plugin(plugin_name)
+    await activate_plugin(plugin_name)
     return info
 
 
@@ -367,6 +700,11 @@ async def load_plugin_elements(elements: PluginElementCollection, plugin_name: s
             if iscoroutinefunction(f):
                 await task
 
+    add_handlers(elements.user_handlers, plugin_name, user)
+    add_handlers(elements.bot_handlers, plugin_name, bot)
+    register_controllers(elements.user_controllers, user, plugin_name)
+    register_controllers(elements.bot_controllers, bot, plugin_name)
+
     if elements.post_load:
         for f in elements.post_load:
             task = asyncio.create_task(f())
@@ -389,9 +727,14 @@ def register_controllers(controllers: list[Callable], client: Client, plugin_nam
 
 def unload_and_remove_plugin(plugin_name: str):
     unload_plugin(plugin_name)
+    plugin_index.forget(plugin_name)
+    # What it installed in the shared venv stays until the venv is recreated
+    shared_env_requirements.pop(plugin_name, None)
 
     folder_path = get_plugin_folder_path(plugin_name)
     rmtree(str(folder_path))
+    # Adding it again later has to import the new code
+    unimport_plugin(plugin_name)
 
 
 def unload_plugin(plugin_name: str):
@@ -403,6 +746,9 @@ def unload_plugin(plugin_name: str):
 
 def remove_plugin_handlers(plugin_name: str, client: Client):
     for handlers in client.dispatcher.groups.values():
-        for handler in handlers:
-            if hasattr(handler, "plugin_handler") and handler.plugin_handler == plugin_name:
+        # A copy, removing while iterating would skip the handler after each removed one
+        for handler in [*handlers]:
+            if isinstance(handler, CallbackQueryRouter):
+                handler.remove_plugin_routes(plugin_name)
+            elif hasattr(handler, "plugin_handler") and handler.plugin_handler == plugin_name:
                 handlers.remove(handler)
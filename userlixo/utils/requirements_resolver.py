@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import Specifier, SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+
+@dataclass(frozen=True)
+class RequirementConflict:
+    name: str
+    # (plugin name, requirement line) for every plugin that asks for the package
+    requested: tuple[tuple[str, str], ...]
+
+    @property
+    def plugins(self) -> set[str]:
+        return {plugin for plugin, _ in self.requested}
+
+    def __str__(self):
+        requested = ", ".join(f"{plugin} wants {line}" for plugin, line in self.requested)
+        return f"{self.name}: {requested}"
+
+
+def parse_requirement(line: str) -> Requirement | None:
+    # None for lines that can't conflict here: URLs/paths, or markers that don't apply
+    try:
+        requirement = Requirement(line)
+    except InvalidRequirement:
+        return None
+    if requirement.url or (requirement.marker and not requirement.marker.evaluate()):
+        return None
+    return requirement
+
+
+def bump_release(version: Version, length: int) -> Version:
+    # The lowest version after every release that starts with the first `length` numbers
+    release = [*version.release[:length]]
+    release[-1] += 1
+    return Version(f"{'.'.join(map(str, release))}.dev0")
+
+
+def get_bounds(specifier: Specifier) -> tuple[tuple, tuple] | None:
+    # ((lower, inclusive), (upper, inclusive)) of the range the specifier allows, None bounds
+    # being unbounded; None when it only excludes or pins versions
+    operator, version = specifier.operator, specifier.version
+    if operator == "==" and version.endswith(".*"):
+        prefix = Version(version.removesuffix(".*"))
+        upper = bump_release(prefix, len(prefix.release))
+        return (Version(f"{prefix}.dev0"), True), (upper, False)
+    if operator in {"!=", "==", "==="}:
+        return None
+
+    version = Version(version)
+    if operator == "~=":
+        return (version, True), (bump_release(version, len(version.release) - 1), False)
+    if operator in {">=", ">"}:
+        return (version, operator == ">="), (None, True)
+    return (None, True), (version, operator == "<=")
+
+
+def is_satisfiable(specifiers: SpecifierSet) -> bool:
+    # Whether any version at all could match, without knowing which versions exist
+    pinned = [spec.version for spec in specifiers if spec.operator in {"==", "==="}]
+    pinned = [version for version in pinned if not version.endswith(".*")]
+    if pinned:
+        return any(specifiers.contains(version, prereleases=True) for version in pinned)
+
+    lowers, uppers = [], []
+    for specifier in specifiers:
+        bounds = get_bounds(specifier)
+        if bounds is None:
+            continue
+        (low, low_inclusive), (high, high_inclusive) = bounds
+        if low is not None:
+            lowers.append((low, not low_inclusive))
+        if high is not None:
+            uppers.append((high, high_inclusive))
+
+    if not lowers or not uppers:
+        return True
+    # The tightest bounds: at the same version an exclusive bound is tighter than an inclusive one
+    lower, upper = max(lowers)[0], min(uppers)[0]
+    if lower < upper:
+        return True
+    return lower == upper and specifiers.contains(lower, prereleases=True)
+
+
+def find_conflicts(requirements_by_plugin: dict[str, Iterable[str]]) -> list[RequirementConflict]:
+    # Merges the requirement lines of every plugin and returns the packages no single version
+    # could satisfy all of them for
+    merged: dict[str, list[tuple[str, str, Requirement]]] = {}
+    for plugin, lines in requirements_by_plugin.items():
+        for line in lines:
+            requirement = parse_requirement(line)
+            if requirement is not None:
+                name = canonicalize_name(requirement.name)
+                merged.setdefault(name, []).append((plugin, line, requirement))
+
+    conflicts = []
+    for name, requested in sorted(merged.items()):
+        if len({plugin for plugin, _, _ in requested}) < 2:
+            continue
+
+        specifiers = SpecifierSet()
+        for _, _, requirement in requested:
+            specifiers &= requirement.specifier
+        try:
+            satisfiable = is_satisfiable(specifiers)
+        except InvalidVersion:
+            # Legacy version strings can't be compared, leave it to pip
+            satisfiable = True
+
+        if not satisfiable:
+            lines = tuple((plugin, line) for plugin, line, _ in requested)
+            conflicts.append(RequirementConflict(name, lines))
+
+    return conflicts
@@ -0,0 +1,173 @@
+import os
+import re
+from dataclasses import dataclass, field
+from itertools import count
+
+from kink import inject
+
+DEFAULT_PREFIXES = "."
+
+# A bare word, optionally followed by a quantifier that makes its last char optional
+LITERAL_HEAD = re.compile(r"\w+(?P<quantifier>[?*{])?")
+# A (possibly named or non-capturing) group made only of word alternatives, e.g. (cmds|commands)
+ALTERNATION_HEAD = re.compile(
+    r"\((?:\?:|\?P<\w+>)?(?P<words>\w+(?:\|\w+)*)\)(?P<quantifier>[?*{])?"
+)
+
+
+def build_prefix_pattern(prefixes: str | list[str]) -> tuple[str, tuple[str, ...]]:
+    if " " in prefixes:
+        parts = prefixes.split()
+        return "(" + "|".join(re.escape(prefix) for prefix in parts) + ")", tuple(parts)
+
+    if isinstance(prefixes, list):
+        prefixes = "".join(prefixes)
+    return f"[{re.escape(prefixes)}]", tuple(prefixes)
+
+
+def has_top_level_alternation(command: str) -> bool:
+    depth = 0
+    escaped = in_class = False
+    for char in command:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+def extract_leading_literals(command: str, flags: int = 0) -> tuple[str, ...]:
+    # Literals every match of `command` must start with. An empty tuple means the route
+    # could start with anything and has to be tried for every prefixed message.
+    if flags & (re.IGNORECASE | re.VERBOSE):
+        return ()
+
+    if match := ALTERNATION_HEAD.match(command):
+        if match["quantifier"]:
+            return ()
+        return tuple(match["words"].split("|"))
+
+    if match := LITERAL_HEAD.match(command):
+        literal = match[0]
+        if match["quantifier"]:
+            literal = literal[:-2]
+        return (literal,) if literal else ()
+
+    return ()
+
+
+@dataclass(frozen=True)
+class CommandRoute:
+    id: int
+    command: str
+    prefixes: str | list[str] | None
+    flags: int
+
+
+@dataclass
+class TrieNode:
+    children: dict[str, "TrieNode"] = field(default_factory=dict)
+    routes: list[int] = field(default_factory=list)
+
+    def insert(self, literal: str, route_id: int):
+        node = self
+        for char in literal:
+            node = node.children.setdefault(char, TrieNode())
+        node.routes.append(route_id)
+
+    def collect(self, text: str, start: int) -> list[int]:
+        found = [*self.routes]
+        node = self
+        for char in text[start:]:
+            node = node.children.get(char)
+            if node is None:
+                break
+            found.extend(node.routes)
+        return found
+
+
+@dataclass(frozen=True)
+class CommandTable:
+    env_prefixes: str
+    tries: dict[str, TrieNode]
+    unanchored: list[int]
+    patterns: dict[int, re.Pattern]
+
+
+@inject
+class CommandRouter:
+    def __init__(self):
+        self.routes: dict[int, CommandRoute] = {}
+        self.ids = count()
+        self.table: CommandTable | None = None
+
+    def add(self, command: str, prefixes=None, flags: int = 0) -> CommandRoute:
+        route = CommandRoute(next(self.ids), command, prefixes, flags)
+        self.routes[route.id] = route
+        self.table = None
+        return route
+
+    def get_table(self) -> CommandTable:
+        env_prefixes = os.getenv("PREFIXES") or DEFAULT_PREFIXES
+        table = self.table
+        if table is None or table.env_prefixes != env_prefixes:
+            table = self.compile(env_prefixes)
+            self.table = table
+        return table
+
+    def compile(self, env_prefixes: str) -> CommandTable:
+        tries: dict[str, TrieNode] = {}
+        unanchored: list[int] = []
+        patterns: dict[int, re.Pattern] = {}
+
+        for route in list(self.routes.values()):
+            prefix_pattern, prefix_literals = build_prefix_pattern(route.prefixes or env_prefixes)
+            patterns[route.id] = re.compile(r"^" + prefix_pattern + route.command, route.flags)
+
+            # "^[.]foo|bar" also matches "bar" anywhere, so it can't be keyed by prefix
+            if has_top_level_alternation(route.command):
+                unanchored.append(route.id)
+                continue
+
+            literals = extract_leading_literals(route.command, route.flags) or ("",)
+            for prefix in prefix_literals:
+                root = tries.setdefault(prefix, TrieNode())
+                for literal in literals:
+                    root.insert(literal, route.id)
+
+        return CommandTable(
+            env_prefixes=env_prefixes, tries=tries, unanchored=unanchored, patterns=patterns
+        )
+
+    def resolve(self, text: str) -> dict[int, list[re.Match]]:
+        table = self.get_table()
+
+        candidates = set(table.unanchored)
+        for prefix, root in table.tries.items():
+            if text.startswith(prefix):
+                candidates.update(root.collect(text, len(prefix)))
+
+        resolved = {}
+        for route_id in sorted(candidates):
+            if matches := list(table.patterns[route_id].finditer(text)):
+                resolved[route_id] = matches
+        return resolved
+
+    def resolve_update(self, update) -> dict[int, list[re.Match]]:
+        # Every su_cmd filter evaluated for the same update shares this single resolution
+        resolved = getattr(update, "_su_cmd_resolved", None)
+        if resolved is None:
+            text = update.text or update.caption
+            resolved = self.resolve(text) if text else {}
+            update._su_cmd_resolved = resolved
+        return resolved
@@ -0,0 +1,55 @@
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from kink import inject
+
+from userlixo.database import repositories
+
+logger = logging.getLogger(__name__)
+
+
+@inject
+class ConfigStore:
+    # In-memory copy of the config table: reads never touch the database, writes go through it
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.parsed: dict[tuple[str, Callable], Any] = {}
+        self.subscribers: list[Callable[[str, str | None], Any]] = []
+
+    async def load(self):
+        self.values = await repositories.get_all_config()
+        self.parsed = {}
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        return self.values.get(key, default)
+
+    def get_parsed(self, key: str, parse: Callable[[str], Any], default: Any = None) -> Any:
+        # Parsed values are kept until the raw value changes, so parse once per write
+        cache_key = (key, parse)
+        if cache_key not in self.parsed:
+            value = self.values.get(key)
+            self.parsed[cache_key] = default if value is None else parse(value)
+        return self.parsed[cache_key]
+
+    async def set(self, key: str, value: str):
+        await repositories.set_config(key, value)
+        self.values[key] = value
+        self.publish(key, value)
+
+    async def delete(self, key: str):
+        await repositories.delete_config(key)
+        self.values.pop(key, None)
+        self.publish(key, None)
+
+    def subscribe(self, callback: Callable[[str, str | None], Any]):
+        self.subscribers.append(callback)
+
+    def publish(self, key: str, value: str | None):
+        self.parsed = {k: v for k, v in self.parsed.items() if k[0] != key}
+
+        for callback in self.subscribers:
+            try:
+                callback(key, value)
+            except Exception:
+                logger.exception("Error in config subscriber for %s", key)
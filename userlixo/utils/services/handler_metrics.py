@@ -0,0 +1,107 @@
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from hydrogram import ContinuePropagation, StopPropagation
+from kink import inject
+
+# Upper bounds (in milliseconds) of the latency histogram buckets; the last one catches the rest
+LATENCY_BUCKETS_MS = (
+    0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, float("inf")
+)  # fmt: skip
+LATENCY_BUCKETS_NS = tuple(bound * 1_000_000 for bound in LATENCY_BUCKETS_MS)
+
+# Control-flow exceptions used by hydrogram's dispatcher, not handler failures
+PROPAGATION_EXCEPTIONS = (StopPropagation, ContinuePropagation)
+
+
+@dataclass
+class HandlerStats:
+    name: str
+    plugin: str | None
+    calls: int = 0
+    errors: int = 0
+    total_ns: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_NS))
+    # Sync handlers record from hydrogram's executor and queries from the database threads, and
+    # `+=` from two threads at once can lose counts
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, elapsed_ns: int, failed: bool):
+        bucket = bisect_left(LATENCY_BUCKETS_NS, elapsed_ns)
+        with self.lock:
+            self.calls += 1
+            self.total_ns += elapsed_ns
+            self.buckets[bucket] += 1
+            if failed:
+                self.errors += 1
+
+    def percentile(self, quantile: float) -> float:
+        if not self.calls:
+            return 0.0
+
+        threshold = quantile * self.calls
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets, strict=True):
+            cumulative += count
+            if cumulative >= threshold:
+                return bound
+        return LATENCY_BUCKETS_MS[-1]
+
+
+@dataclass(frozen=True)
+class HandlerStatsSnapshot:
+    name: str
+    plugin: str | None
+    calls: int
+    errors: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    buckets: tuple[int, ...]
+
+
+@inject
+class HandlerMetrics:
+    def __init__(self):
+        self.enabled = os.getenv("HANDLER_METRICS") == "true"
+        self.stats: dict[tuple[str, str | None], HandlerStats] = {}
+
+    def track(self, name: str, plugin: str | None = None) -> HandlerStats:
+        key = (name, plugin)
+        if key not in self.stats:
+            self.stats[key] = HandlerStats(name=name, plugin=plugin)
+        return self.stats[key]
+
+    @staticmethod
+    def summarize(stats: HandlerStats) -> HandlerStatsSnapshot:
+        calls = stats.calls
+        total_ms = stats.total_ns / 1_000_000
+        return HandlerStatsSnapshot(
+            name=stats.name,
+            plugin=stats.plugin,
+            calls=calls,
+            errors=stats.errors,
+            total_ms=total_ms,
+            mean_ms=total_ms / calls if calls else 0.0,
+            p50_ms=stats.percentile(0.50),
+            p95_ms=stats.percentile(0.95),
+            p99_ms=stats.percentile(0.99),
+            buckets=tuple(stats.buckets),
+        )
+
+    def snapshot(self) -> list[HandlerStatsSnapshot]:
+        snapshots = []
+        for stats in list(self.stats.values()):
+            with stats.lock:
+                snapshots.append(self.summarize(stats))
+        return sorted(snapshots, key=lambda s: s.total_ms, reverse=True)
+
+    def reset(self):
+        for stats in self.stats.values():
+            with stats.lock:
+                stats.calls = stats.errors = stats.total_ns = 0
+                stats.buckets = [0] * len(LATENCY_BUCKETS_NS)
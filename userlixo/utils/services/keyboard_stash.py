@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from kink import inject
+
+SPILL_FOLDER = Path("cache")
+# How long Telegram may cache the bot's answer for a token, and so how long the user side can
+# keep sending the result it got. Kept below the stash TTL so cached answers always resolve.
+RESULT_CACHE_TIME = 300
+
+
+@dataclass(frozen=True)
+class StashedKeyboard:
+    text: str
+    keyboard: list
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class InlineResult:
+    query_id: int
+    result_id: str
+    expires_at: float
+
+
+def write_spill_file(path: Path, entry: StashedKeyboard):
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+
+
+def read_spill_file(path: Path) -> StashedKeyboard | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return StashedKeyboard(**data)
+
+
+@inject
+class KeyboardStash:
+    # Keyboards waiting for the inline query that sends them, see patches.reply_text. Tokens are
+    # derived from the content, so identical replies (menus, help...) share one entry, one bot
+    # answer cached by Telegram and one inline result the userbot can send again. Spilling them
+    # to cache/ also keeps them across a crash or restart.
+    def __init__(self):
+        self.capacity = 1024
+        # Same lifetime as the files in cache/ (see utils.cache.clean_cache)
+        self.ttl = 600
+        self.spill = os.getenv("KEYBOARD_STASH_SPILL") == "true"
+        # Keyed so tokens can't be guessed from the content they point to
+        self.secret = secrets.token_bytes(32)
+        self.entries: OrderedDict[str, StashedKeyboard] = OrderedDict()
+        self.results: dict[str, InlineResult] = {}
+
+    @staticmethod
+    def get_spill_path(token: str) -> Path:
+        return SPILL_FOLDER / f"keyboard-{token}.json"
+
+    def get_token(self, text: str, keyboard: list) -> str:
+        content = json.dumps([text, keyboard], sort_keys=True, ensure_ascii=False)
+        digest = hmac.new(self.secret, content.encode(), hashlib.sha256).digest()
+        # Only digits, as the inline query that redeems it is matched by ^\d+
+        return str(int.from_bytes(digest[:8], "big"))
+
+    def evict(self):
+        now = time.time()
+        while self.entries:
+            token, entry = next(iter(self.entries.items()))
+            if len(self.entries) <= self.capacity and entry.expires_at > now:
+                break
+            del self.entries[token]
+            self.results.pop(token, None)
+
+    async def put(self, text: str, keyboard: list) -> str:
+        token = self.get_token(text, keyboard)
+        entry = StashedKeyboard(text, keyboard, time.time() + self.ttl)
+
+        self.entries[token] = entry
+        self.entries.move_to_end(token)
+        self.evict()
+
+        if self.spill:
+            await asyncio.to_thread(write_spill_file, self.get_spill_path(token), entry)
+        return token
+
+    async def get(self, token: str) -> StashedKeyboard | None:
+        entry = self.entries.get(token)
+        if entry is None and self.spill:
+            entry = await asyncio.to_thread(read_spill_file, self.get_spill_path(token))
+
+        if entry is None or entry.expires_at < time.time():
+            return None
+        return entry
+
+    def get_result(self, token: str) -> InlineResult | None:
+        result = self.results.get(token)
+        if result is None or result.expires_at < time.time():
+            return None
+        return result
+
+    def set_result(self, token: str, query_id: int, result_id: str, cache_time: int):
+        cache_time = min(cache_time, RESULT_CACHE_TIME)
+        self.results[token] = InlineResult(query_id, result_id, time.time() + cache_time)
+
+    def forget_result(self, token: str):
+        self.results.pop(token, None)
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+
+from kink import inject
+
+from userlixo.utils.services.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_PATH = re.compile(r"userlixo[\\/]plugins[\\/](?P<name>[^\\/]+)[\\/]")
+
+
+@dataclass(frozen=True)
+class LoopStall:
+    plugin: str | None
+    stack: str
+
+
+def attribute_frame(frame: FrameType | None, owners: dict[CodeType, str]) -> str | None:
+    # Walks from the innermost (blocking) frame outwards, so the closest plugin wins
+    while frame is not None:
+        if frame.f_code in owners:
+            return owners[frame.f_code]
+        if match := PLUGIN_PATH.search(frame.f_code.co_filename):
+            return match["name"]
+        frame = frame.f_back
+    return None
+
+
+@inject
+class LoopLagMonitor:
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self.interval = 0.5
+        self.task: asyncio.Task | None = None
+
+        self.threshold = float(os.getenv("LOOP_LAG_THRESHOLD") or 1)
+        self.alert_interval = float(os.getenv("LOOP_LAG_ALERT_INTERVAL") or 300)
+        self.owners: dict[CodeType, str] = {}
+        self.watchdog: threading.Thread | None = None
+        self.stopped = threading.Event()
+
+        self.deadline = 0.0
+        self.loop_thread_id: int | None = None
+        self.pending_stall: LoopStall | None = None
+        self.last_alerts: dict[str | None, float] = {}
+        self.suppressed_alerts: Counter[str | None] = Counter()
+        self.background_tasks = set()
+        # Set by the bootstrap since sending needs the clients: (lag, plugin, stack, suppressed)
+        self.alert = None
+
+    def tag_code(self, code: CodeType, plugin: str):
+        self.owners[code] = plugin
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.loop_thread_id = threading.get_ident()
+            self.deadline = time.perf_counter() + self.interval + self.threshold
+            self.task = asyncio.create_task(self.run())
+
+        if self.threshold > 0 and (self.watchdog is None or not self.watchdog.is_alive()):
+            self.stopped.clear()
+            self.watchdog = threading.Thread(target=self.watch, name="loop-watchdog", daemon=True)
+            self.watchdog.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            self.deadline = expected + self.threshold
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.metrics.record_loop_lag(lag)
+
+            stall, self.pending_stall = self.pending_stall, None
+            if stall is not None:
+                self.report(lag, stall)
+
+    # Runs in its own thread: the loop can't notice it's blocked while it's blocked
+    def watch(self):
+        captured_deadline = None
+        while not self.stopped.wait(self.threshold / 4):
+            deadline = self.deadline
+            if time.perf_counter() < deadline or deadline == captured_deadline:
+                continue
+
+            captured_deadline = deadline
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+
+            plugin = attribute_frame(frame, self.owners)
+            stack = "".join(traceback.format_stack(frame))
+            self.pending_stall = LoopStall(plugin, stack)
+
+    def report(self, lag: float, stall: LoopStall):
+        logger.warning(
+            "Event loop blocked for %.2fs by %s:\n%s", lag, stall.plugin or "core", stall.stack
+        )
+
+        now = time.monotonic()
+        last_alert = self.last_alerts.get(stall.plugin)
+        if last_alert is not None and now - last_alert < self.alert_interval:
+            self.suppressed_alerts[stall.plugin] += 1
+            return
+
+        self.last_alerts[stall.plugin] = now
+        suppressed = self.suppressed_alerts.pop(stall.plugin, 0)
+        if self.alert is None:
+            return
+
+        task = asyncio.create_task(self.alert(lag, stall.plugin, stall.stack, suppressed))
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
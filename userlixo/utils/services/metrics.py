@@ -0,0 +1,39 @@
+from collections import Counter
+
+from kink import inject
+
+from userlixo.utils.services.handler_metrics import HandlerStats
+
+
+@inject
+class Metrics:
+    # Process-wide counters fed by cheap hooks (client.invoke, the database, raw update handlers).
+    # Every hook checks `enabled` first, so nothing is counted unless the exporter is running.
+    def __init__(self):
+        self.enabled = False
+
+        self.updates_received: Counter[str] = Counter()
+        self.api_calls: Counter[tuple[str, str]] = Counter()
+        self.flood_waits: Counter[str] = Counter()
+        self.flood_wait_seconds: Counter[str] = Counter()
+        self.db_queries = HandlerStats(name="database", plugin=None)
+
+        self.loop_lag_seconds = 0.0
+        self.loop_lag_max_seconds = 0.0
+
+    def record_update(self, client_name: str):
+        self.updates_received[client_name] += 1
+
+    def record_api_call(self, client_name: str, method: str):
+        self.api_calls[client_name, method] += 1
+
+    def record_flood_wait(self, client_name: str, seconds: int):
+        self.flood_waits[client_name] += 1
+        self.flood_wait_seconds[client_name] += seconds
+
+    def record_db_query(self, elapsed_ns: int, failed: bool):
+        self.db_queries.record(elapsed_ns, failed)
+
+    def record_loop_lag(self, lag_seconds: float):
+        self.loop_lag_seconds = lag_seconds
+        self.loop_lag_max_seconds = max(self.loop_lag_max_seconds, lag_seconds)
@@ -0,0 +1,209 @@
+import asyncio
+import contextlib
+import logging
+import os
+from pathlib import Path
+
+from hydrogram.handlers import RawUpdateHandler
+from kink import inject
+
+from userlixo.config import plugins
+from userlixo.types.client import Client
+from userlixo.utils.lazy import lazy_import
+from userlixo.utils.plugins import get_inactive_plugins
+from userlixo.utils.services.handler_metrics import (
+    LATENCY_BUCKETS_MS,
+    HandlerMetrics,
+    HandlerStats,
+)
+from userlixo.utils.services.loop_monitor import LoopLagMonitor
+from userlixo.utils.services.metrics import Metrics
+
+psutil = lazy_import("psutil")
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Raw handlers in this group see every update before any other handler
+UPDATES_COUNTER_GROUP = -1000
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{escape_label(v)}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+def format_bound(bound_ms: float) -> str:
+    return "+Inf" if bound_ms == float("inf") else repr(bound_ms / 1000)
+
+
+class MetricsWriter:
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str):
+        self.lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"))
+
+    def sample(self, name: str, value, **labels):
+        self.lines.append(f"{name}{format_labels(labels)} {value}")
+
+    def histogram(self, name: str, stats: HandlerStats, **labels):
+        with stats.lock:
+            buckets, total_ns, calls = [*stats.buckets], stats.total_ns, stats.calls
+
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, buckets, strict=True):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, **labels, le=format_bound(bound))
+        self.sample(f"{name}_sum", total_ns / 1e9, **labels)
+        self.sample(f"{name}_count", calls, **labels)
+
+    def getvalue(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def parse_metrics_address(address: str) -> tuple[str | None, str | int]:
+    # "unix:/path/to.sock" or "host:port"; returns (None, path) for unix sockets
+    if address.startswith("unix:"):
+        return None, address.removeprefix("unix:")
+
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+@inject
+class MetricsExporter:
+    def __init__(
+        self, metrics: Metrics, handler_metrics: HandlerMetrics, loop_monitor: LoopLagMonitor
+    ):
+        self.metrics = metrics
+        self.handler_metrics = handler_metrics
+        self.loop_monitor = loop_monitor
+        self.server: asyncio.Server | None = None
+        self.process = psutil.Process(os.getpid())
+
+    async def start(self, address: str, clients: list[Client]):
+        self.metrics.enabled = True
+        self.handler_metrics.enabled = True
+        self.loop_monitor.start()
+
+        for client in clients:
+            client.add_handler(RawUpdateHandler(self.count_update), UPDATES_COUNTER_GROUP)
+
+        host, port = parse_metrics_address(address)
+        if host is None:
+            with contextlib.suppress(FileNotFoundError):
+                Path(port).unlink()
+            self.server = await asyncio.start_unix_server(self.handle_connection, path=port)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port)
+
+        logger.info("Serving metrics at %s", address)
+
+    async def stop(self):
+        self.loop_monitor.stop()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def count_update(self, client: Client, *_args):
+        self.metrics.record_update(client.kind)
+
+    @staticmethod
+    async def read_request_path(reader: asyncio.StreamReader) -> str | None:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # Drain the headers, we don't need any of them
+        while (await asyncio.wait_for(reader.readline(), timeout=5)).strip():
+            pass
+
+        parts = request_line.decode("latin-1").split()
+        if len(parts) < 2 or parts[0] != "GET":
+            return None
+        return parts[1].split("?")[0]
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            path = await self.read_request_path(reader)
+            writer.write(self.build_response(path))
+            await writer.drain()
+        except (TimeoutError, ConnectionError) as e:
+            logger.debug("Metrics connection dropped: %s", e)
+        finally:
+            writer.close()
+
+    def build_response(self, path: str | None) -> bytes:
+        if path == "/metrics":
+            status, body = "200 OK", self.render().encode()
+        else:
+            status, body = "404 Not Found", b"Not Found\n"
+
+        head = (
+            f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        )
+        return head.encode() + body
+
+    def render(self) -> str:
+        out = MetricsWriter()
+        metrics = self.metrics
+
+        out.family("userlixo_updates_received_total", "counter", "Updates received per client.")
+        for client_name, value in sorted(metrics.updates_received.items()):
+            out.sample("userlixo_updates_received_total", value, client=client_name)
+
+        handler_stats = list(self.handler_metrics.stats.values())
+        out.family("userlixo_handler_duration_seconds", "histogram", "Handler latency.")
+        for stats in handler_stats:
+            labels = {"handler": stats.name, "plugin": stats.plugin or ""}
+            out.histogram("userlixo_handler_duration_seconds", stats, **labels)
+
+        out.family("userlixo_handler_errors_total", "counter", "Handler calls that raised.")
+        for stats in handler_stats:
+            labels = {"handler": stats.name, "plugin": stats.plugin or ""}
+            out.sample("userlixo_handler_errors_total", stats.errors, **labels)
+
+        out.family("userlixo_event_loop_lag_seconds", "gauge", "Last measured loop lag.")
+        out.sample("userlixo_event_loop_lag_seconds", metrics.loop_lag_seconds)
+        out.family("userlixo_event_loop_lag_max_seconds", "gauge", "Highest loop lag seen.")
+        out.sample("userlixo_event_loop_lag_max_seconds", metrics.loop_lag_max_seconds)
+
+        out.family("userlixo_db_query_duration_seconds", "histogram", "Database query latency.")
+        out.histogram("userlixo_db_query_duration_seconds", metrics.db_queries)
+        out.family("userlixo_db_query_errors_total", "counter", "Database queries that failed.")
+        out.sample("userlixo_db_query_errors_total", metrics.db_queries.errors)
+
+        out.family("userlixo_api_calls_total", "counter", "Telegram API calls per method.")
+        for (client_name, method), value in sorted(metrics.api_calls.items()):
+            out.sample("userlixo_api_calls_total", value, client=client_name, method=method)
+
+        out.family("userlixo_flood_waits_total", "counter", "FloodWait errors raised.")
+        for client_name, value in sorted(metrics.flood_waits.items()):
+            out.sample("userlixo_flood_waits_total", value, client=client_name)
+        out.family("userlixo_flood_wait_seconds_total", "counter", "Seconds asked to wait.")
+        for client_name, value in sorted(metrics.flood_wait_seconds.items()):
+            out.sample("userlixo_flood_wait_seconds_total", value, client=client_name)
+
+        inactive = get_inactive_plugins(plugins)
+        active_total = len([name for name in plugins if name not in inactive])
+        out.family("userlixo_plugins", "gauge", "Installed plugins by state.")
+        out.sample("userlixo_plugins", active_total, state="active")
+        out.sample("userlixo_plugins", len(plugins) - active_total, state="inactive")
+
+        with self.process.oneshot():
+            memory = self.process.memory_info()
+            cpu = self.process.cpu_times()
+            out.family("userlixo_process_resident_memory_bytes", "gauge", "Resident memory.")
+            out.sample("userlixo_process_resident_memory_bytes", memory.rss)
+            out.family("userlixo_process_cpu_seconds_total", "counter", "User and system CPU.")
+            out.sample("userlixo_process_cpu_seconds_total", cpu.user + cpu.system)
+            out.family("userlixo_process_threads", "gauge", "OS threads.")
+            out.sample("userlixo_process_threads", self.process.num_threads())
+
+        return out.getvalue()
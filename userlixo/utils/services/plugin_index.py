@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from kink import inject
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path("userlixo/plugins/.index.json")
+
+
+@dataclass(frozen=True)
+class IndexedManifest:
+    mtime_ns: int
+    size: int
+    sha256: str
+    # The parsed plugin.toml, only indexed once it passed validation
+    manifest: dict
+
+
+@inject
+class PluginIndex:
+    # Keeps every plugin's validated manifest across restarts, keyed by plugin name: an
+    # unchanged plugin.toml costs a stat instead of being parsed and validated again
+    def __init__(self):
+        self.path = INDEX_PATH
+        self.entries: dict[str, IndexedManifest] | None = None
+
+    def load(self) -> dict[str, IndexedManifest]:
+        if self.entries is None:
+            self.entries = {}
+            try:
+                content = json.loads(self.path.read_text(encoding="utf-8"))
+                self.entries = {name: IndexedManifest(**entry) for name, entry in content.items()}
+            except FileNotFoundError:
+                pass
+            except (ValueError, TypeError) as e:
+                logger.warning("Ignoring the broken plugin index at %s: %s", self.path, e)
+        return self.entries
+
+    def save(self):
+        entries = {}
+        for name, entry in self.load().items():
+            try:
+                json.dumps(entry.manifest)
+            except (TypeError, ValueError) as e:
+                # e.g. TOML dates; only that manifest is parsed again after a restart
+                logger.debug("Could not index the manifest of %s: %s", name, e)
+                continue
+            entries[name] = asdict(entry)
+        content = json.dumps(entries)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(content, encoding="utf-8")
+        temporary.replace(self.path)
+
+    def get_manifest(
+        self, plugin_name: str, manifest_path: Path, parse: Callable[[bytes], dict]
+    ) -> dict:
+        # parse() runs (and may raise) only when the content changed since it was indexed
+        entries = self.load()
+        stat = manifest_path.stat()
+        entry = entries.get(plugin_name)
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry.manifest
+
+        content = manifest_path.read_bytes()
+        sha256 = hashlib.sha256(content).hexdigest()
+        manifest = entry.manifest if entry is not None and entry.sha256 == sha256 else None
+        if manifest is None:
+            manifest = parse(content)
+
+        # The stat is from before reading, so a write in between only causes another hash
+        entries[plugin_name] = IndexedManifest(stat.st_mtime_ns, stat.st_size, sha256, manifest)
+        self.save()
+        return manifest
+
+    def forget(self, plugin_name: str):
+        if self.load().pop(plugin_name, None) is not None:
+            self.save()
+
+    def prune(self, plugin_names: Iterable[str]):
+        # Drops plugins that aren't installed anymore
+        stale = self.load().keys() - set(plugin_names)
+        for plugin_name in stale:
+            del self.entries[plugin_name]
+        if stale:
+            self.save()
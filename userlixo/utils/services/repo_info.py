@@ -0,0 +1,128 @@
+import asyncio
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from kink import inject
+
+from userlixo.utils.misc import shell_exec, timezone_shortener
+
+GIT_DIR = Path(".git")
+SHA = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    sha: str
+    short_sha: str
+    count: int
+    # Committer date in the committer's timezone, e.g. "31/12 23:59" and "-0300"
+    date: str
+    timezone: str
+
+    @property
+    def date_with_timezone(self) -> str:
+        return f"{self.date} ({timezone_shortener(self.timezone)})"
+
+
+def resolve_git_dir(git_path: Path) -> tuple[Path, Path]:
+    # Returns (git dir, common dir). In worktrees and submodules .git is a file pointing at the
+    # real git dir, and a worktree keeps its branches in the main repository's common dir
+    git_dir = git_path
+    if git_path.is_file():
+        content = git_path.read_text(encoding="utf-8").strip()
+        git_dir = git_path.parent / content.removeprefix("gitdir:").strip()
+
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = git_dir / commondir_file.read_text(encoding="utf-8").strip()
+    return git_dir, common_dir
+
+
+def read_ref(git_dir: Path, ref: str) -> str | None:
+    loose = git_dir / ref
+    if loose.is_file():
+        return loose.read_text(encoding="utf-8").strip()
+
+    try:
+        packed_refs = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+    for line in packed_refs.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name.strip() == ref:
+            return sha
+    return None
+
+
+def read_head(git_path: Path) -> tuple[str | None, str | None]:
+    # Returns (branch, sha); branch is None for a detached HEAD, sha for an unborn branch or
+    # when it can't be read (then git is asked instead)
+    try:
+        git_dir, common_dir = resolve_git_dir(git_path)
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            return None, head
+
+        ref = head.removeprefix("ref:").strip()
+        return ref.removeprefix("refs/heads/"), read_ref(common_dir, ref)
+    except OSError:
+        return None, None
+
+
+def parse_commit_info(sha: str, output: str) -> CommitInfo:
+    count, short_sha, committed_at = output.splitlines()[-3:]
+    committed_at = datetime.strptime(committed_at, "%Y-%m-%d %H:%M:%S %z")
+    return CommitInfo(
+        sha=sha,
+        short_sha=short_sha,
+        count=int(count),
+        date=committed_at.strftime("%d/%m %H:%M"),
+        timezone=committed_at.strftime("%z"),
+    )
+
+
+async def resolve_head_sha() -> str | None:
+    output, process = await shell_exec("git rev-parse HEAD")
+    sha = output.strip()
+    return sha if process.returncode == 0 and SHA.match(sha) else None
+
+
+@inject
+class RepoInfo:
+    # Reads HEAD straight from .git and asks git for the rest once per commit, so version info
+    # is a lookup until HEAD moves (upgrades restart the process anyway)
+    def __init__(self):
+        self.git_dir = GIT_DIR
+        self.commit: CommitInfo | None = None
+        self.lock = asyncio.Lock()
+
+    def get_branch(self) -> str | None:
+        return read_head(self.git_dir)[0]
+
+    def get_head_sha(self) -> str | None:
+        sha = read_head(self.git_dir)[1]
+        return sha if sha and SHA.match(sha) else None
+
+    async def get_commit(self) -> CommitInfo:
+        sha = self.get_head_sha() or await resolve_head_sha()
+        if sha is None:
+            msg = "Not a git repository or HEAD has no commits"
+            raise RuntimeError(msg)
+
+        async with self.lock:
+            if self.commit is None or self.commit.sha != sha:
+                output, process = await shell_exec(
+                    f"git rev-list --count {sha} && git log -1 --format=%h%n%ci {sha}"
+                )
+                if process.returncode != 0:
+                    msg = f"Could not read commit info: {output}"
+                    raise RuntimeError(msg)
+                self.commit = parse_commit_info(sha, output)
+
+            return self.commit
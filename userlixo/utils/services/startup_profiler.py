@@ -0,0 +1,85 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from kink import inject
+
+from userlixo.utils.lazy import lazy_import
+
+psutil = lazy_import("psutil")
+
+logger = logging.getLogger(__name__)
+
+STATS_PATH = Path("startup.pstats")
+REPORT_PATH = Path("startup.txt")
+
+
+@inject
+class StartupProfiler:
+    # `python -m userlixo --profile-startup` (or PROFILE_STARTUP=true) runs the boot under
+    # cProfile and records how long each phase took
+    def __init__(self):
+        self.enabled = "--profile-startup" in sys.argv or os.getenv("PROFILE_STARTUP") == "true"
+        self.profile: cProfile.Profile | None = None
+        self.timings: dict[str, float] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.profile is not None
+
+    def start(self):
+        if not self.enabled or self.running:
+            return
+
+        # Everything before main() runs: interpreter startup and imports
+        started_at = psutil.Process(os.getpid()).create_time()
+        self.timings = {"imports": time.time() - started_at}
+
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    @contextmanager
+    def measure(self, name: str):
+        if not self.running:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float):
+        if self.running:
+            self.timings[name] = seconds
+
+    def format_report(self) -> str:
+        width = max(map(len, self.timings), default=0)
+        return "\n".join(
+            f"{name:<{width}}  {seconds:8.3f}s" for name, seconds in self.timings.items()
+        )
+
+    def finish(self) -> str | None:
+        # Stops profiling and writes the stats files, returns the phase breakdown
+        if not self.running:
+            return None
+
+        self.profile.disable()
+        self.profile.dump_stats(STATS_PATH)
+
+        report = self.format_report()
+        top_functions = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=top_functions)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+        REPORT_PATH.write_text(f"{report}\n\n{top_functions.getvalue()}", encoding="utf-8")
+
+        self.profile = None
+        logger.warning("Startup profile written to %s and %s", STATS_PATH, REPORT_PATH)
+        return report
@@ -0,0 +1,111 @@
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from hydrogram import Client
+from kink import inject
+
+from userlixo.utils.misc import tryint
+from userlixo.utils.services.config_store import ConfigStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SudoerIndex:
+    entries: tuple[int | str, ...]
+    ids: frozenset[int]
+    usernames: frozenset[str]
+
+
+def normalize_sudoer(value: int | str) -> int | str:
+    return tryint(str(value).lstrip("@").lower())
+
+
+def build_sudoer_index(entries: Iterable[int | str], owner_id: int | None) -> SudoerIndex:
+    normalized = dict.fromkeys(normalize_sudoer(x) for x in entries if str(x).strip())
+    normalized.pop("me", None)
+    normalized.pop(owner_id, None)
+
+    entries = tuple(normalized)
+    ids = {x for x in entries if isinstance(x, int)}
+    if owner_id is not None:
+        ids.add(owner_id)
+    usernames = {x for x in entries if isinstance(x, str)}
+
+    return SudoerIndex(entries=entries, ids=frozenset(ids), usernames=frozenset(usernames))
+
+
+@inject
+class SudoerRegistry:
+    def __init__(self, config_store: ConfigStore):
+        self.config_store = config_store
+        self.owner_id: int | None = None
+        self.index = build_sudoer_index((), None)
+        self.unresolvable: set[str] = set()
+
+    # The index is immutable and only ever replaced as a whole, so the filters (which run in
+    # the client's executor threads) always see a consistent snapshot without locking.
+    def swap(self, entries: Iterable[int | str]):
+        self.index = build_sudoer_index(entries, self.owner_id)
+
+    def load(self, value: str | None):
+        self.swap((value or "").split())
+
+    def set_owner(self, owner_id: int):
+        self.owner_id = owner_id
+        self.swap(self.index.entries)
+
+    def add(self, entry: int | str):
+        self.swap((*self.index.entries, entry))
+
+    def remove(self, entry: int | str):
+        entry = normalize_sudoer(entry)
+        self.swap(x for x in self.index.entries if x != entry)
+
+    def is_sudoer(self, user) -> bool:
+        index = self.index
+        if user.id in index.ids:
+            return True
+        return bool(user.username) and user.username.lower() in index.usernames
+
+    @property
+    def entries(self) -> tuple[int | str, ...]:
+        return self.index.entries
+
+    @property
+    def members(self) -> tuple[int | str, ...]:
+        if self.owner_id is None:
+            return self.index.entries
+        return (self.owner_id, *self.index.entries)
+
+    def dump(self) -> str:
+        return " ".join(map(str, self.index.entries))
+
+    async def save(self):
+        await self.config_store.set("SUDOERS_LIST", self.dump())
+
+    async def resolve_usernames(self, client: Client):
+        pending = [
+            x for x in self.index.entries if isinstance(x, str) and x not in self.unresolvable
+        ]
+        if not pending:
+            return
+
+        resolved = {}
+        for username in pending:
+            try:
+                resolved_user = await client.get_users(username)
+            except Exception as e:
+                logger.warning("Could not resolve sudoer @%s: %s", username, e)
+                self.unresolvable.add(username)
+                continue
+            resolved[username] = resolved_user.id
+
+        if not resolved:
+            return
+
+        # Entries may have changed while we were awaiting, so map over the latest ones
+        self.swap(resolved.get(x, x) for x in self.index.entries)
+        await self.save()
+        logger.debug("Resolved %d sudoer username(s) to ids", len(resolved))
@@ -0,0 +1,93 @@
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import cached_property
+
+import hydrogram
+from kink import inject
+
+from userlixo.utils.lazy import lazy_import
+
+psutil = lazy_import("psutil")
+
+
+@dataclass(frozen=True)
+class ProcessStats:
+    uptime: timedelta
+    rss: int
+    cpu_percent: float
+    threads: int
+    # None where the platform doesn't expose it (Windows)
+    open_fds: int | None
+
+
+def get_operating_system() -> str:
+    # What `uname -o` prints
+    if hasattr(sys, "getandroidapilevel"):
+        return "Android"
+    if sys.platform == "linux":
+        return "GNU/Linux"
+    return platform.system()
+
+
+def get_uname() -> str:
+    # Same fields and order as `uname -mons`
+    uname = platform.uname()
+    return f"{uname.system} {uname.node} {uname.machine} {get_operating_system()}"
+
+
+BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
+def format_bytes(size: float) -> str:
+    unit = 0
+    while size >= 1024 and unit < len(BYTE_UNITS) - 1:
+        size /= 1024
+        unit += 1
+    return f"{size:.1f} {BYTE_UNITS[unit]}"
+
+
+@inject
+class SystemInfo:
+    # Static facts are read once; process stats come from psutil without spawning anything.
+    # psutil itself is only imported when the first stats are asked for
+    def __init__(self):
+        self.pid = os.getpid()
+        self.uname = get_uname()
+        self.python_version = platform.python_version()
+        self.hydrogram_version = hydrogram.__version__
+        self.cpu_measured = False
+
+    @cached_property
+    def process(self):
+        return psutil.Process(self.pid)
+
+    @cached_property
+    def started_at(self) -> float:
+        return self.process.create_time()
+
+    def get_uptime(self) -> timedelta:
+        return timedelta(seconds=int(time.time() - self.started_at))
+
+    def get_cpu_percent(self) -> float:
+        # psutil measures from its previous call, so the first reading is the average since start
+        if self.cpu_measured:
+            return self.process.cpu_percent()
+
+        self.cpu_measured = True
+        self.process.cpu_percent()
+        cpu = self.process.cpu_times()
+        return (cpu.user + cpu.system) / max(time.time() - self.started_at, 1) * 100
+
+    def get_stats(self) -> ProcessStats:
+        with self.process.oneshot():
+            return ProcessStats(
+                uptime=self.get_uptime(),
+                rss=self.process.memory_info().rss,
+                cpu_percent=self.get_cpu_percent(),
+                threads=self.process.num_threads(),
+                open_fds=self.process.num_fds() if hasattr(self.process, "num_fds") else None,
+            )
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+import os
+import shlex
+import time
+
+from kink import inject
+
+from userlixo.utils.misc import shell_exec
+from userlixo.utils.services.repo_info import RepoInfo
+
+logger = logging.getLogger(__name__)
+
+
+@inject
+class UpdateChecker:
+    # Polls the remote in the background so .info, the web app and .upgrade read the latest
+    # known remote version instead of waiting on the network
+    def __init__(self, repo_info: RepoInfo):
+        self.repo_info = repo_info
+        self.task: asyncio.Task | None = None
+
+        # A remote name or any URL/path git accepts, e.g. a local repository
+        self.remote = os.getenv("UPDATE_REMOTE") or "origin"
+        self.branch = os.getenv("UPDATE_BRANCH")
+        # Seconds between checks, 0 disables them
+        self.interval = float(os.getenv("UPDATE_CHECK_INTERVAL") or 3600)
+        self.retry_interval = 60.0
+        self.failures = 0
+
+        self.remote_version: int | None = None
+        self.checked_at: float | None = None
+
+    def start(self):
+        if self.interval > 0 and (self.task is None or self.task.done()):
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def get_remote_version(self) -> int | None:
+        # Last known value, None until the first check succeeds
+        return self.remote_version
+
+    def record(self, remote_version: int):
+        self.remote_version = remote_version
+        self.checked_at = time.time()
+        self.failures = 0
+
+    def get_delay(self) -> float:
+        if not self.failures:
+            return self.interval
+        return min(self.interval, self.retry_interval * 2 ** (self.failures - 1))
+
+    async def check(self) -> int:
+        branch = self.branch or self.repo_info.get_branch()
+        if not branch:
+            msg = "No branch to compare with the remote"
+            raise RuntimeError(msg)
+
+        remote, branch = shlex.quote(self.remote), shlex.quote(branch)
+        output, process = await shell_exec(
+            f"GIT_TERMINAL_PROMPT=0 git fetch --quiet {remote} {branch}"
+            " && git rev-list --count FETCH_HEAD"
+        )
+        if process.returncode != 0:
+            msg = f"Could not fetch {self.remote}: {output}"
+            raise RuntimeError(msg)
+
+        remote_version = int(output.splitlines()[-1])
+        self.record(remote_version)
+        return remote_version
+
+    async def run(self):
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Error while checking for updates: %s", e)
+
+            await asyncio.sleep(self.get_delay())
@@ -1,19 +1,27 @@
+import html
 import logging
 import os
-import platform
 import sys
 from datetime import UTC, datetime
 
-import hydrogram
 from hydrogram.errors import BadRequest
 from hydrogram.helpers import ikb
+from kink import di
 from langs import Langs
 from rich import box, print
 from rich.panel import Panel
 
-from userlixo.config import bot, plugins, sudoers, user
-from userlixo.database import Config
-from userlixo.utils import shell_exec, timezone_shortener, tryint
+from userlixo.config import (
+    bot,
+    config_store,
+    plugins,
+    repo_info,
+    sudoer_registry,
+    system_info,
+    user,
+)
+from userlixo.utils import tryint
+from userlixo.utils.services.language_selector import LanguageSelector
 
 logger = logging.getLogger(__name__)
 
@@ -31,25 +39,16 @@ def update_requirements():
 
 
 async def compose_startup_message(lang: Langs):
-    local_version = int((await shell_exec("git rev-list --count HEAD"))[0])
-    python_version = platform.python_version()
-    hydrogram_version = hydrogram.__version__
-    system_uname = (await shell_exec("uname -mons"))[0]
-
-    pid = os.getpid()
-    uptime = (
-        await shell_exec("ps -o pid,etime --no-headers -p " + str(pid) + " | awk '{print $2}' ")
-    )[0]
-
+    commit = await repo_info.get_commit()
     plugins_total = len(plugins)
 
     return lang.started_alert(
-        version=local_version,
-        pid=pid,
-        python_version=python_version,
-        hydrogram_version=hydrogram_version,
-        server_uname=system_uname,
-        uptime=uptime,
+        version=commit.count,
+        pid=system_info.pid,
+        python_version=system_info.python_version,
+        hydrogram_version=system_info.hydrogram_version,
+        server_uname=system_info.uname,
+        uptime=system_info.get_uptime(),
         plugins_total=plugins_total,
     )
 
@@ -58,39 +57,40 @@ async def compose_restarting_message(lang: Langs, cmd_timestamp: float, from_cmd
     now_timestamp = datetime.now(tz=UTC).timestamp()
     diff = round(now_timestamp - cmd_timestamp, 2)
 
-    _title, _p = await shell_exec('git log --format="%B" -1')
-    rev, _p = await shell_exec("git rev-parse --short HEAD")
-    date, _p = await shell_exec('git log -1 --format=%cd --date=format:"%d/%m %H:%M"')
-    timezone, _p = await shell_exec('git log -1 --format=%cd --date=format:"%z"')
-    local_version = int((await shell_exec("git rev-list --count HEAD"))[0])
-
-    timezone = timezone_shortener(timezone)
-    date += f" ({timezone})"
+    commit = await repo_info.get_commit()
 
     text = lang.upgraded_alert if from_cmd.startswith("upgrade") else lang.restarted_alert
 
-    return text(rev=rev, date=date, seconds=diff, local_version=local_version)
+    return text(
+        rev=commit.short_sha,
+        date=commit.date_with_timezone,
+        seconds=diff,
+        local_version=commit.count,
+    )
 
 
-async def print_cli_startup_alert():
-    date, _p = await shell_exec('git log -1 --format=%cd --date=format:"%d/%m %H:%M"')
-    timezone, _p = await shell_exec('git log -1 --format=%cd --date=format:"%z"')
-    local_version = int((await shell_exec("git rev-list --count HEAD"))[0])
+def format_startup_timings(timings: dict[str, float]) -> str:
+    phases = sorted(timings.keys() - {"total"}, key=timings.get, reverse=True)
+    details = ", ".join(f"{name} {timings[name]:.2f}s" for name in phases)
+    return f"{timings['total']:.2f}s ({details})"
 
-    timezone = timezone_shortener(timezone)
-    date += f" ({timezone})"
+
+async def print_cli_startup_alert(timings: dict[str, float] | None = None):
+    commit = await repo_info.get_commit()
     mention = "@" + user.me.username if user.me.username else user.me.id
     text = []
 
     userlixo_info = {
-        "Version": local_version,
+        "Version": commit.count,
         "Account": mention,
         "Bot": "@" + bot.me.username,
         "Prefixes": os.getenv("PREFIXES"),
         "Logs_chat": os.getenv("LOGS_CHAT"),
-        "Sudoers": ", ".join([*set(map(str, sudoers))]),  # using set() to make the values unique
-        "Commit_date": date,
+        "Sudoers": ", ".join(map(str, sudoer_registry.members)),
+        "Commit_date": commit.date_with_timezone,
     }
+    if timings:
+        userlixo_info["Startup"] = format_startup_timings(timings)
     for k, v in userlixo_info.items():
         text.append(f"[orchid]{k}:[/] {v}")
 
@@ -106,27 +106,75 @@ async def print_cli_startup_alert():
     )
 
 
-async def alert_startup(lang: Langs):
-    text = await compose_startup_message(lang)
+def escape_tail(text: str, limit: int) -> str:
+    # The end of text, HTML-escaped and at most limit characters long once escaped
+    escaped, size = [], 0
+    for char in reversed(text[-limit:]):
+        char = html.escape(char)
+        if size + len(char) > limit:
+            break
+        escaped.append(char)
+        size += len(char)
+    return "".join(reversed(escaped))
+
+
+async def send_to_logs_chat(text: str):
     logs_chat = os.getenv("LOGS_CHAT")
+    if logs_chat and logs_chat != "me":
+        return await user.send_message(logs_chat, text)
 
     try:
-        if logs_chat and logs_chat != "me":
-            return await user.send_message(logs_chat, text)
+        return await bot.send_message(user.me.username, text)
+    except BadRequest:
+        # The user never started a chat with the bot
+        return await user.send_message("me", text)
 
-        try:
-            await bot.send_message(user.me.username, text)
-        except BadRequest:
-            await user.send_message(logs_chat, text)
+
+async def alert_startup(lang: Langs):
+    text = await compose_startup_message(lang)
+
+    try:
+        await send_to_logs_chat(text)
     except Exception as e:
         logger.error("[bold yellow]Error while sending startup alert to LOGS_CHAT: %s", e)
 
 
+async def alert_loop_stall(lag: float, plugin: str | None, stack: str, suppressed: int):
+    lang = di[LanguageSelector].get_lang()
+    suppressed_text = f" {lang.loop_blocked_suppressed(count=suppressed)}" if suppressed else ""
+    # Stacks are full of <module> and <lambda>, escaped here so they can be cut to length
+    lang.escape_html = False
+    text = lang.loop_blocked_alert(
+        seconds=round(lag, 2),
+        source=html.escape(plugin or lang.loop_blocked_source_core),
+        suppressed=suppressed_text,
+        # Telegram caps messages at 4096 characters, the innermost frames matter the most
+        stack=escape_tail(stack, 3000),
+    )
+
+    try:
+        await send_to_logs_chat(text)
+    except Exception as e:
+        logger.error("[bold yellow]Error while sending loop stall alert to LOGS_CHAT: %s", e)
+
+
+async def send_startup_profile(report: str):
+    lang = di[LanguageSelector].get_lang()
+    # Function names like <module> need escaping too
+    lang.escape_html = False
+    text = lang.startup_profile_alert(report=escape_tail(report, 3500))
+
+    try:
+        await send_to_logs_chat(text)
+    except Exception as e:
+        logger.error("[bold yellow]Error while sending startup profile to LOGS_CHAT: %s", e)
+
+
 async def edit_restarting_alert(lang: Langs):
-    restarting_alert = Config.get_or_none(Config.key == "restarting_alert")
+    restarting_alert = config_store.get("restarting_alert")
 
     if restarting_alert:
-        message_id, chat_id, cmd_timestamp, from_cmd = restarting_alert.value.split("|")
+        message_id, chat_id, cmd_timestamp, from_cmd = restarting_alert.split("|")
 
         text = await compose_restarting_message(lang, float(cmd_timestamp), from_cmd)
 
@@ -148,4 +196,4 @@ async def edit_restarting_alert(lang: Langs):
                 e,
             )
 
-        restarting_alert.delete_instance()
+        await config_store.delete("restarting_alert")
@@ -0,0 +1,187 @@
+import base64
+import csv
+import hashlib
+import logging
+import os
+import re
+import shlex
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from shutil import rmtree
+
+from userlixo.utils import shell_exec
+
+logger = logging.getLogger(__name__)
+
+# Wheels shared by every plugin venv: each distribution is downloaded/built once, then installed
+# from here. Set PLUGIN_WHEELS_OFFLINE=true to never reach an index.
+WHEELHOUSE_PATH = Path(os.getenv("PLUGIN_WHEELHOUSE") or "wheelhouse")
+# Names of the wheels the wheelhouse built or downloaded itself, the only ones it ever deletes
+MANAGED_WHEELS_PATH = WHEELHOUSE_PATH / ".managed"
+# Content-addressed copies of installed files, hardlinked into every venv that has them
+STORE_PATH = WHEELHOUSE_PATH / ".store"
+BUILD_PREFIX = "build-"
+
+
+def get_find_links() -> list[str]:
+    # PLUGIN_FIND_LINKS adds wheel directories of your own (separated by os.pathsep), e.g. to
+    # install offline; they're only read from
+    extra = os.getenv("PLUGIN_FIND_LINKS") or ""
+    return [str(WHEELHOUSE_PATH), *filter(None, extra.split(os.pathsep))]
+
+
+def is_offline() -> bool:
+    return os.getenv("PLUGIN_WHEELS_OFFLINE") == "true"
+
+
+def normalize_distribution_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+def get_site_packages(venv_path: str | Path) -> list[Path]:
+    return list(Path(venv_path).glob("lib/python*/site-packages"))
+
+
+def get_installed_distributions(venv_path: str | Path) -> set[tuple[str, str]]:
+    installed = set()
+    for site_packages in get_site_packages(venv_path):
+        for dist_info in site_packages.glob("*.dist-info"):
+            name, _, version = dist_info.name.removesuffix(".dist-info").rpartition("-")
+            installed.add((normalize_distribution_name(name), version))
+    return installed
+
+
+def read_managed_wheels() -> set[str]:
+    try:
+        return set(MANAGED_WHEELS_PATH.read_text(encoding="utf-8").split())
+    except FileNotFoundError:
+        return set()
+
+
+def write_managed_wheels(names: Iterable[str]):
+    MANAGED_WHEELS_PATH.write_text(
+        "".join(f"{name}\n" for name in sorted(names)), encoding="utf-8"
+    )
+
+
+async def install_requirements(venv_path: str, requirements_txt_path: str):
+    WHEELHOUSE_PATH.mkdir(exist_ok=True)
+    pip = f"{venv_path}/bin/pip"
+    index = "--no-index" if is_offline() else ""
+    find_links = " ".join(f"--find-links {shlex.quote(path)}" for path in get_find_links())
+
+    # Wheels are built in a private folder and moved in when complete, so plugins prepared at
+    # the same time never see half-written wheels
+    build_path = Path(tempfile.mkdtemp(prefix=BUILD_PREFIX, dir=WHEELHOUSE_PATH))
+    try:
+        stdout, process = await shell_exec(
+            f"{pip} wheel {index} {find_links} --wheel-dir {build_path} -r {requirements_txt_path}"
+        )
+        if process.returncode != 0:
+            msg = f"Error while building wheels: {stdout}"
+            raise ValueError(msg)
+
+        # Wheels taken from the find-links directories are copied here too, the originals are
+        # never touched
+        managed = read_managed_wheels()
+        for wheel in build_path.glob("*.whl"):
+            target = WHEELHOUSE_PATH / wheel.name
+            # A wheel that was there but isn't managed was put there by hand, it stays unmanaged
+            if not target.exists():
+                managed.add(wheel.name)
+            wheel.replace(target)
+        write_managed_wheels(managed)
+    finally:
+        rmtree(build_path, ignore_errors=True)
+
+    stdout, process = await shell_exec(
+        f"{pip} install --no-index {find_links} -r {requirements_txt_path}"
+    )
+    if process.returncode != 0:
+        msg = f"Error while installing requirements: {stdout}"
+        raise ValueError(msg)
+
+    return stdout
+
+
+def hash_file(path: Path) -> str:
+    # Same encoding as the hashes in RECORD files
+    with path.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256").digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def link_to_store(path: Path, file_hash: str) -> int:
+    # Returns how many bytes were saved by pointing path at an identical stored file
+    stored = STORE_PATH / file_hash
+    if stored.exists() and path.samefile(stored):
+        return 0
+    # Files edited after install don't match their RECORD hash anymore, leave them alone
+    if hash_file(path) != file_hash:
+        return 0
+
+    if not stored.exists():
+        os.link(path, stored)
+        return 0
+
+    temporary = path.with_name(f"{path.name}.userlixo-link")
+    os.link(stored, temporary)
+    temporary.replace(path)
+    return stored.stat().st_size
+
+
+def deduplicate_venv(venv_path: str | Path) -> int:
+    STORE_PATH.mkdir(parents=True, exist_ok=True)
+
+    saved = 0
+    for site_packages in get_site_packages(venv_path):
+        for record in site_packages.glob("*.dist-info/RECORD"):
+            for row in csv.reader(record.read_text(encoding="utf-8").splitlines()):
+                if len(row) < 2 or not row[1].startswith("sha256="):
+                    continue
+
+                path = site_packages / row[0]
+                if path.is_symlink() or not path.is_file():
+                    continue
+
+                try:
+                    saved += link_to_store(path, row[1].removeprefix("sha256="))
+                except OSError as e:
+                    # e.g. the store is on another filesystem, the copy just stays a copy
+                    logger.debug("Could not deduplicate %s: %s", path, e)
+
+    return saved
+
+
+def collect_garbage(venv_paths: Iterable[str | Path]) -> list[Path]:
+    # Removes managed wheels no venv has installed and stored files no venv links to anymore;
+    # wheels someone else put in the wheelhouse are left alone
+    installed = set()
+    for venv_path in venv_paths:
+        installed |= get_installed_distributions(venv_path)
+
+    removed = []
+    managed = read_managed_wheels()
+    for wheel_name in sorted(managed):
+        wheel = WHEELHOUSE_PATH / wheel_name
+        name, version = wheel_name.split("-")[:2]
+        if not wheel.exists():
+            managed.discard(wheel_name)
+        elif (normalize_distribution_name(name), version) not in installed:
+            wheel.unlink()
+            managed.discard(wheel_name)
+            removed.append(wheel)
+    if MANAGED_WHEELS_PATH.exists():
+        write_managed_wheels(managed)
+
+    for stored in STORE_PATH.glob("*"):
+        if stored.stat().st_nlink == 1:
+            stored.unlink()
+            removed.append(stored)
+
+    # Left behind by installs that were interrupted
+    for build_path in WHEELHOUSE_PATH.glob(f"{BUILD_PREFIX}*"):
+        rmtree(build_path, ignore_errors=True)
+
+    return removed